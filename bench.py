@@ -0,0 +1,107 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import time
+
+from day import PARTS
+from days import available_days, get_day
+from utils import memo, render
+
+
+def measure(day_class, part):
+    # every sample starts from scratch, not with what the warmup or the sample before memoized
+    memo.clear_all()
+    day = day_class()
+    day.input  # parsing is not benchmarked
+
+    # parts building on others need their predecessors, but those are not what we measure
+    for prev in day.dependencies(part):
+        getattr(day, f'part{prev}')()
+
+    start = time.perf_counter_ns()
+    result = getattr(day, f'part{part}')()
+    return time.perf_counter_ns() - start, result
+
+
+def percentile(ordered, percent):
+    # nearest rank
+    return ordered[max(math.ceil(len(ordered) * percent / 100) - 1, 0)]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'p95': percentile(ordered, 95),
+        'mean': statistics.mean(ordered),
+        'stddev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'samples': samples,
+    }
+
+
+def bench(day_class, part, repeat, warmup):
+    samples = []
+    result = None
+
+    # the days like to print things, which we neither want to see nor measure the terminal for
+    render.use(render.NullSink())
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            measure(day_class, part)
+
+        for _ in range(repeat):
+            elapsed, result = measure(day_class, part)
+            samples.append(elapsed)
+
+    stats = summarize(samples)
+    stats['result'] = repr(result)
+    return stats
+
+
+def ms(value):
+    return f'{value / 1_000_000:10.3f}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark days with warmup and repetitions')
+    parser.add_argument('days', nargs='*', help='days to benchmark, defaults to all of them')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only benchmark this part')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='measured runs per part')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='unmeasured runs before measuring')
+    parser.add_argument('-o', '--output', default='bench.json', help='where to write the JSON results')
+    args = parser.parse_args()
+
+    numbers = [int(day) for day in args.days] or sorted(available_days())
+    parts = args.part or PARTS
+
+    print(f'{"":12} {"min ms":>10} {"median ms":>10} {"p95 ms":>10} {"stddev ms":>10}')
+
+    results = []
+    for number in numbers:
+        day_class = get_day(number)
+        for part in parts:
+            stats = bench(day_class, part, args.repeat, args.warmup)
+            stats.update(day=number, part=part)
+            results.append(stats)
+
+            label = f'{day_class.__name__}.{part}'
+            print(f'{label:12} {ms(stats["min"])} {ms(stats["median"])} {ms(stats["p95"])} {ms(stats["stddev"])}')
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'timestamp': time.time(),
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+            'unit': 'ns',
+            'results': results,
+        }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+
+from utils.daemon import DEFAULT_SOCKET, request
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ask a running solver (main.py --serve) to solve a day')
+    parser.add_argument('day', type=int, nargs='?', help='day to solve')
+    parser.add_argument('--part', type=int, action='append', help='only solve this part')
+    parser.add_argument('--input', help='input file, defaults to the one in inputs/')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='where the solver listens')
+    parser.add_argument('--stop', action='store_true', help='shut the solver down')
+    args = parser.parse_args()
+
+    if args.stop:
+        request({'stop': True}, args.socket)
+        return
+    if args.day is None:
+        parser.error('a day is required')
+
+    message = {'day': args.day, 'parts': args.part}
+    if args.input:
+        # the solver does not necessarily run in the same directory
+        message['input'] = os.path.abspath(args.input)
+
+    response = request(message, args.socket)
+    if 'error' in response:
+        print(response['error'], file=sys.stderr)
+        sys.exit(1)
+
+    for part, result in response['parts'].items():
+        print(f'Part {part} result: {result["result"]} ({result["elapsed"]:.6f}s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import os
+import sys
+import tempfile
+
+from day import PARTS, OK, DEFAULT_STRATEGY
+from days import select_days
+from utils.generators import generate
+from utils.supervisor import supervise
+
+
+def run(day_class, file_name, part, strategy, timeout, repeat):
+    # the best of `repeat` runs, each in a process of its own so nothing carries over from the last one,
+    # not even what got memoized
+    best = None
+    for _ in range(repeat):
+        result, = supervise(day_class(input_file=file_name), [part], timeout or None, strategy=strategy)
+
+        if result.status != OK:
+            return result
+        if best is None or result.elapsed < best.elapsed:
+            best = result
+    return best
+
+
+def compare(day_class, file_name, parts, timeout, repeat):
+    """
+    runs every strategy of the parts that have more than one on the same input, and reports how much
+    faster each is than the default. returns the number of strategies that came up with another answer.
+    """
+    different = 0
+    for part in parts:
+        strategies = day_class.strategies(part)
+        if len(strategies) < 2:
+            continue
+
+        print(f'{day_class.__name__} part {part} ({file_name})')
+        reference = None
+        for strategy in [DEFAULT_STRATEGY, *sorted(set(strategies) - {DEFAULT_STRATEGY})]:
+            result = run(day_class, file_name, part, strategy, timeout, repeat)
+            if strategy == DEFAULT_STRATEGY:
+                reference = result
+
+            if result.status != OK:
+                print(f'  {strategy:<12} {result.status:>10}')
+                continue
+
+            speedup = ''
+            if reference.status == OK and result.elapsed:
+                speedup = f'{reference.elapsed / result.elapsed:.2f}x'
+
+            marker = ''
+            if reference.status == OK and result.result != reference.result:
+                marker = f'  DIFFERENT ANSWER, default has {reference.result}'
+                different += 1
+            print(f'  {strategy:<12} {result.elapsed:9.3f}s {speedup:>9}  {result.result}{marker}')
+        print()
+
+    return different
+
+
+def main():
+    parser = argparse.ArgumentParser(description='check that the strategies of a day agree, and which is fastest')
+    parser.add_argument('day', nargs='?', default='all', help='days to compare, like 15, 1-5,9 or "all"')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only compare this part')
+    parser.add_argument('--generate', type=float, metavar='SCALE', help='use a generated input of this size')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the generator')
+    parser.add_argument('--timeout', type=float, default=60, help='give up on a strategy after this many seconds')
+    parser.add_argument('--repeat', type=int, default=1, help='time every strategy this often, keeping the best')
+    args = parser.parse_args()
+
+    parts = sorted(set(args.part)) if args.part else PARTS
+    try:
+        selected = select_days(args.day)
+    except ValueError as error:
+        parser.error(str(error))
+    selected = [day for day in selected if any(len(day.strategies(part)) > 1 for part in parts)]
+    if not selected:
+        print('Nothing to compare, none of these parts has more than one strategy')
+        return
+
+    different = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for day_class in selected:
+            file_name = None
+            if args.generate:
+                number = int(day_class.__name__[3:])
+                file_name = os.path.join(tmp, f'day{number:02}_x{args.generate:g}.txt')
+                with open(file_name, 'w') as f:
+                    f.write(generate(number, args.generate, args.seed))
+
+            different += compare(day_class, file_name or day_class().input_file, parts, args.timeout, args.repeat)
+
+    if different:
+        print(f'{different} strategies disagree with the default')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
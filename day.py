@@ -1,35 +1,295 @@
+import contextlib
+import io
 import os.path
+from functools import cached_property
 
-from utils.timer import Timer
+from utils import accounting as acc
+from utils import counters as cnt
+from utils import render, search
+from utils.inputs import TEXT, LINES, open_input
+from utils.cache import MISSING, StateCache, source_hash
+from utils import timer as tracer
+from utils.timer import Timer, span
+
+PARTS = (1, 2)
+
+OK = 'ok'
+TIMEOUT = 'timeout'
+ERROR = 'error'
+SKIPPED = 'skipped'
+
+# what partN itself is called as a strategy, the one the others are compared to
+DEFAULT_STRATEGY = 'default'
+
+
+def strategy(part, name):
+    # registers a method as another way to solve `part`, run instead of partN with --strategy `name`
+    def register(method):
+        method.strategy = (part, name)
+        return method
+    return register
+
+
+class PartResult:
+    def __init__(self, day, part, result=None, elapsed=None, output='', status=OK):
+        self.day = day
+        self.part = part
+        self.result = result
+        self.elapsed = elapsed
+        self.output = output
+        self.status = status
+        self.cached = False
+        self.stats = None
+        self.profile = None
+        self.trace = None
+        self.counters = None
+        self.max_rss = None
+        self.strategy = None
+
+    def __setstate__(self, state):
+        # results pickled by an older version may lack attributes added since
+        self.__init__(state['day'], state['part'])
+        self.__dict__.update(state)
+
+    def __repr__(self):
+        return f'{self.day}.part{self.part}({self.result!r} in {self.elapsed}s)'
+
+    def report(self):
+        if self.output:
+            print(self.output, end='')
+
+        if self.status == TIMEOUT:
+            print(f'Part {self.part} timed out after {self.elapsed}s')
+            return
+        if self.status == ERROR:
+            print(f'Part {self.part} failed after {self.elapsed}s:\n{self.result}')
+            return
+        if self.status == SKIPPED:
+            print(f'Part {self.part} skipped, it depends on a part that did not finish')
+            return
+
+        using = f' using {self.strategy}' if self.strategy else ''
+        if self.cached:
+            print(f'Cached (completed in {self.elapsed}s{using})')
+        else:
+            print(f'Completed in {self.elapsed}s{using}')
+        if self.stats:
+            acc.report(self.stats)
+        if self.counters:
+            cnt.report(self.counters)
+        if self.profile:
+            print(self.profile)
+        print(f'Part {self.part} result: {self.result}')
 
 
 class Day:
-    def __init__(self):
-        self.input = self._load()
+    # the parts a part builds on, e.g. {2: (1,)} if part2 needs the state part1 left on the instance.
+    # those always run before it on the same instance, all other parts may run concurrently
+    requires = {}
+
+    # what parse() gets handed: the whole file as str (TEXT), a lazy line iterator (LINES),
+    # or the raw bytes as mmap (MMAP) or memoryview (BUFFER)
+    input_mode = TEXT
+
+    # how many candidates search() tries at once, each in its own process
+    probes = 1
+
+    def __init__(self, parsed_cache=None, input_file=None):
+        self.input_file = input_file or f'inputs/{self.__class__.__name__.lower()}.txt'
+        self.parsed_cache = parsed_cache
+
+    @cached_property
+    def input(self):
+        # only read and parse once a part actually needs it
+        with span('parse', day=self.__class__.__name__):
+            return self._load()
 
     def parse(self, content):
+        if self.input_mode == LINES:
+            # already split, and we want to keep it lazy
+            return content
         return content.split('\n')
 
+    @classmethod
+    def dependencies(cls, part):
+        # every part `part` builds on, directly or not, in the order they have to run
+        found = []
+        for required in cls.requires.get(part, ()):
+            for dependency in cls.dependencies(required) + [required]:
+                if dependency not in found:
+                    found.append(dependency)
+        return found
+
+    @classmethod
+    def groups(cls, parts=PARTS):
+        # splits the parts into groups that have to run on the same instance, one after the other
+        groups = []
+        for part in parts:
+            linked = {part, *cls.dependencies(part)}
+            for group in [group for group in groups if linked & group]:
+                groups.remove(group)
+                linked |= group
+            groups.append(linked)
+        return sorted(sorted(group & set(parts)) for group in groups)
+
+    @classmethod
+    def strategies(cls, part):
+        # strategy names for `part` and the methods implementing them, partN always being the default
+        found = {DEFAULT_STRATEGY: f'part{part}'}
+        for attribute in dir(cls):
+            marked = getattr(getattr(cls, attribute), 'strategy', None)
+            if marked and marked[0] == part:
+                found[marked[1]] = attribute
+        return found
+
+    def search(self, predicate, start=0, verify=1, monotone=True):
+        """
+        the smallest value >= start for which `predicate` has a result, as (value, result).
+        bisects unless the predicate is not `monotone`, see utils.search.
+        with more than one probe the predicate has to be picklable.
+        """
+        executor = None
+        if self.probes > 1:
+            # the pool machinery is slow to import as well, only searches with more than one probe need it
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(self.probes)
+        try:
+            if monotone:
+                return search.first(predicate, start, self.probes, executor, verify)
+            return search.scan(predicate, start, self.probes, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
     def part1(self):
         raise NotImplementedError()
 
     def part2(self):
         return 'Not (yet) implemented'
 
-    def run(self):
+    def solve(self, part, capture=False, accounting=False, profile=None, trace=False, counters=False, probes=None,
+              sink=None, strategy=None):
+        """
+        runs a single part and times it. `accounting` adds resource usage to the result,
+        `profile` is the number of hot functions to list if the part should be profiled,
+        `trace` hands the spans recorded in this process over to the result,
+        `counters` adds what the solver counted while running the part,
+        `probes` is how many candidates a parameter search may try at once,
+        `sink` is where rendered output goes instead of stdout,
+        `strategy` picks one of the strategies() of the part, parts without it use the default.
+        """
+        if probes:
+            self.probes = probes
+        if sink:
+            render.use(sink)
+        if trace:
+            tracer.enable_tracing()
+        if counters:
+            cnt.enable()
+        self.input  # parsing is not part of the timing
+        cnt.collect()  # neither is counted work
+        name = self.__class__.__name__
+        strategies = self.strategies(part)
+        strategy = strategy if strategy in strategies else DEFAULT_STRATEGY
+        output = io.StringIO()
+        stdout = contextlib.redirect_stdout(output) if capture else contextlib.nullcontext()
+        account = acc.Accounting() if accounting else contextlib.nullcontext()
+        profiler = contextlib.nullcontext()
+        if profile:
+            # cProfile and pstats take longer to import than most days take to solve, only --profile needs them
+            from utils.profiler import Profile
+            profiler = Profile(f'{name.lower()}.part{part}', profile)
+
+        # the peak of this part alone, not of the parts and parsing that ran in this process before
+        own_peak = acc.reset_max_rss()
+        with stdout:
+            try:
+                with account, Timer(silent=True) as timer, profiler, span(f'part{part}', day=name):
+                    result = getattr(self, strategies[strategy])()
+            finally:
+                counted = cnt.collect() if counters else None
+                # whatever the part wanted to show is only built now that the timing is done
+                render.flush()
+
+        part_result = PartResult(name, part, result, timer.total, output.getvalue())
+        part_result.max_rss = acc.max_rss() if own_peak else None
+        if strategy != DEFAULT_STRATEGY:
+            part_result.strategy = strategy
+        if accounting:
+            part_result.stats = account.stats
+        if profile:
+            part_result.profile = profiler.summary
+        if trace:
+            part_result.trace = tracer.collect()
+        if counters:
+            part_result.counters = counted
+        return part_result
+
+    def solve_parts(self, parts=PARTS, cache=None, capture=False, **options):
+        key = source_hash(self) if cache else None
+        hits = {part: cache.get(key, part) for part in parts} if cache else {}
+        # parts others build on leave their state next to their result, so those can pick up from there
+        states = StateCache() if cache else None
+        required = {dependency for dependencies in self.requires.values() for dependency in dependencies}
+
+        # a part that has to run needs the parts it builds on to run first, cached or not
+        run = set()
+        for part in parts:
+            if not hits.get(part):
+                run.update([part, *self.dependencies(part)])
+
+        for part in sorted(run | set(parts)):
+            result = hits.get(part)
+            if part in run:
+                if part in parts and not result:
+                    result = self.solve(part, capture, **options)
+                    if cache:
+                        cache.put(key, part, result)
+                    if states and part in required:
+                        states.put(key, part, self)
+                elif not (states and states.restore(key, part, self)):
+                    # only needed for its state, nobody asked for the result (or it is cached)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        getattr(self, f'part{part}')()
+                    render.discard()
+                    if states:
+                        states.put(key, part, self)
+
+            if part in parts:
+                yield result
+
+    def run(self, cache=None, timeout=None, parts=PARTS, history=None, **options):
         print(f'=== {self.__class__.__name__} ===')
-        with Timer():
-            result = self.part1()
-        print(f'Part 1 result: {result}')
 
-        with Timer():
-            result = self.part2()
-        print(f'Part 2 result: {result}\n')
+        groups = self.groups(parts)
+        if len(groups) > 1:
+            from utils.supervisor import supervise_groups
+            results = supervise_groups(self, groups, timeout, cache=cache, **options)
+        elif timeout:
+            from utils.supervisor import supervise
+            results = supervise(self, parts, timeout, cache=cache, **options)
+        else:
+            results = self.solve_parts(parts, cache, **options)
+
+        for result in results:
+            result.report()
+            if result.trace:
+                tracer.add_events(result.trace)
+            if history:
+                history.add(result)
+        print()
 
     def _load(self):
-        file_name = f'inputs/{self.__class__.__name__.lower()}.txt'
-        if not os.path.isfile(f'inputs/{self.__class__.__name__.lower()}.txt'):
-            raise ValueError(f'Missing input file "{file_name}"')
+        if not os.path.isfile(self.input_file):
+            raise ValueError(f'Missing input file "{self.input_file}"')
+
+        key = source_hash(self) if self.parsed_cache else None
+        if key:
+            parsed = self.parsed_cache.load(key)
+            if parsed is not MISSING:
+                return parsed
 
-        with open(file_name, 'r') as f:
-            return self.parse(f.read())
+        parsed = self.parse(open_input(self.input_file, self.input_mode))
+        if key:
+            self.parsed_cache.store(key, parsed)
+        return parsed
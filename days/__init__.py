@@ -1,18 +1,54 @@
-import os
 import importlib
+import os
+import re
+
+rx_module = re.compile(r'^day(?P<number>\d+)\.py$')
+
+
+def available_days():
+    # maps day numbers to module names by looking at the files, nothing gets imported here
+    days = {}
+    for file in os.listdir(os.path.dirname(__file__)):
+        match = rx_module.match(file)
+        if match:
+            days[int(match.group('number'))] = f'days.{file[:-3]}'
+    return days
 
-from day import Day
+
+def get_day(number):
+    modules = available_days()
+    if number not in modules:
+        raise ValueError(f'Day {number} does not exist')
+
+    module = importlib.import_module(modules[number])
+    return getattr(module, f'Day{number:02}')
 
 
 def get_days():
-    days = []
-    files = [
-        file for file in os.listdir(os.path.dirname(__file__))
-        if file.endswith('py') and file != '__init__.py'
-    ]
+    return [get_day(number) for number in sorted(available_days())]
+
+
+def select_days(selection=None):
+    # "all", numbers and ranges like "1-5,9", or nothing for the latest day
+    if selection is None:
+        return [get_day(max(available_days()))]
+    if selection == 'all':
+        return get_days()
 
-    for file in files:
-        mod_name = file[:-3]
-        importlib.import_module(f'days.{mod_name}')
+    numbers = set()
+    for item in selection.split(','):
+        first, _, last = item.partition('-')
+        try:
+            days = range(int(first), int(last or first) + 1)
+        except ValueError:
+            raise ValueError(f'Invalid day selection "{item}"') from None
+        if not days:
+            raise ValueError(f'Invalid day selection "{item}", ranges go from the first day to the last')
+        numbers.update(days)
 
-    return Day.__subclasses__()
+    # all of them checked before importing any, so a typo doesn't fail halfway through a run
+    missing = sorted(numbers - available_days().keys())
+    if missing:
+        names = ', '.join(str(number) for number in missing)
+        raise ValueError(f'Day {names} does not exist' if len(missing) == 1 else f'Days {names} do not exist')
+    return [get_day(number) for number in sorted(numbers)]
@@ -1,23 +1,24 @@
 from day import Day
+from utils.inputs import LINES
 
 
 class Day01(Day):
+    input_mode = LINES
+
+    def parse(self, content):
+        # streamed, only the changes are kept and not the lines. int() takes care of the signs
+        return [int(line) for line in content if line]
 
     def part1(self):
-        total = 0
-        for line in self.input:
-            mul = 1 if line[0] == '+' else -1
-            total += mul * int(line[1:])
-        return total
+        return sum(self.input)
 
     def part2(self):
         encountered = {0}
         current = 0
 
         while True:
-            for line in self.input:
-                mul = 1 if line[0] == '+' else -1
-                current += mul * int(line[1:])
+            for change in self.input:
+                current += change
 
                 if current in encountered:
                     return current
@@ -2,6 +2,7 @@ import re
 from collections import defaultdict
 
 from day import Day
+from utils.inputs import LINES
 
 rx_line = re.compile(r'#(?P<id>\d+) @ (?P<x>\d+),(?P<y>\d+): (?P<w>\d+)x(?P<h>\d+)')
 
@@ -47,6 +48,7 @@ class Part:
 
 
 class Day03(Day):
+    input_mode = LINES
 
     def parse(self, content):
         return [Part(line) for line in super().parse(content) if line]
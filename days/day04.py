@@ -3,6 +3,7 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 
 from day import Day
+from utils.inputs import LINES
 
 
 rx_date = re.compile(r'\[(?P<date>\d+-\d+-\d+ \d+:\d+)] (?P<entry>.+)$')
@@ -60,6 +61,7 @@ class Log:
 
 
 class Day04(Day):
+    input_mode = LINES
 
     def parse(self, content):
         log = Log()
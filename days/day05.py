@@ -1,7 +1,11 @@
+import hashlib
 import re
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-from day import Day
+from day import Day, strategy
+from utils.memo import memo
+from utils.shared import Shared, attach
 
 rx_replace = re.compile(r'^(?P<before>.*?)(?P<rep>([a-z])(?=[A-Z])(?i:\3)|(([A-Z])(?=[a-z])(?i:\5)))(?P<after>.*)')
 
@@ -25,17 +29,44 @@ class Day05(Day):
             base = match.group('before') + match.group('after')
         return base
 
+    # the handle changes with every run, the polymer behind it does not
     @staticmethod
-    def _replace_without_char(data):
-        without = re.sub(data[0], '', data[1], flags=re.I)
-        return len(Day05._replace(without))
+    @memo(persist=True, key=lambda char, handle: (char, hashlib.sha256(attach(handle)).hexdigest()))
+    def _replace_without_char(char, handle):
+        # runs in a worker process, the polymer is only attached to, not copied over
+        without = re.sub(char.encode(), b'', attach(handle), flags=re.I)
+        return len(Day05._replace(without.decode()))
+
+    @staticmethod
+    def _react(polymer):
+        # a unit either reacts with the last one left over, or is left over itself
+        stack = []
+        for unit in polymer:
+            if stack and stack[-1] != unit and stack[-1].lower() == unit.lower():
+                stack.pop()
+            else:
+                stack.append(unit)
+        return ''.join(stack)
+
+    @strategy(1, 'stack')
+    def part1_stack(self):
+        return len(self._react(self.input))
+
+    @strategy(2, 'stack')
+    def part2_stack(self):
+        # units that react anyway react just as well with another type removed, so that only has to happen once
+        reacted = self._react(self.input)
+        return min(
+            len(self._react(reacted.replace(char, '').replace(char.upper(), '')))
+            for char in set(self.input.lower())
+        )
 
     def part2(self):
-        removable = set(self.input.lower())
+        removable = sorted(set(self.input.lower()))
 
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            data = ((item, self.input) for item in removable)
-            results = executor.map(Day05._replace_without_char, data)
+        # threads would only take turns on the GIL, this is all regex work
+        with Shared(self.input) as polymer, ProcessPoolExecutor() as executor:
+            results = executor.map(Day05._replace_without_char, removable, repeat(polymer.handle))
             min_len = min(results)
 
         return min_len
@@ -1,6 +1,8 @@
 import re
 
 from day import Day
+from utils import render
+from utils.inputs import LINES
 from utils.point import Point
 
 rx_point = re.compile(r'position=< ?(?P<x>-?\d+),  ?(?P<y>-?\d+)> velocity=< ?(?P<vx>-?\d+),  ?(?P<vy>-?\d+)>')
@@ -58,10 +60,7 @@ class Grid:
         result = True
         lines = []
         for y in range(min_y, max_y + 1):
-            line = ''
-            for x in range(min_x, max_x + 1):
-                chr = '#' if (x, y) in positions else '.'
-                line += chr
+            line = ''.join('#' if (x, y) in positions else '.' for x in range(min_x, max_x + 1))
 
             lines.append(line)
             if '#####' in line:
@@ -70,6 +69,8 @@ class Grid:
 
 
 class Day10(Day):
+    input_mode = LINES
+
     def parse(self, content):
         grid = Grid()
 
@@ -91,7 +92,7 @@ class Day10(Day):
             result, lines = self.input.print()
 
             if result:
-                print('\n'.join(lines))
+                render.write('\n'.join(lines))
                 break
 
         return iterations
@@ -1,7 +1,11 @@
+import io
 from collections import defaultdict
+from functools import partial
 
 from day import Day
+from utils import counters
 from utils.point import UniquePoint
+from utils.shared import Shared, attach, detach
 from utils.timer import Timer
 
 WALL = 'wall'
@@ -148,16 +152,13 @@ class Battlefield:
                 self.field[-1].append(parsed)
 
     def print(self):
-        frame = ''
+        frame = io.StringIO()
         for line in self.field:
-            rep = ''
-            units = ''
-            for col in line:
-                rep += self._symbol(col)
-                if isinstance(col, Unit):
-                    units += f'{self._symbol(col)} ({col.hp})   '
-            frame += rep + '  => ' + units + '\n'
-        return frame
+            frame.write(''.join(self._symbol(col) for col in line))
+            frame.write('  => ')
+            frame.write(''.join(f'{self._symbol(col)} ({col.hp})   ' for col in line if isinstance(col, Unit)))
+            frame.write('\n')
+        return frame.getvalue()
 
     def kill(self, unit):
         self.units.remove(unit)
@@ -230,6 +231,8 @@ class Battlefield:
                 return self._rollback(prev, end)
 
             queue.remove(current)
+            counters.incr('day15.nodes_expanded')
+            counters.observe('day15.queue_size', len(queue))
             for next_point in self.next_possible(current):
                 next_score = g_score[current] + 1
                 if next_point not in g_score or next_score < g_score[next_point]:
@@ -243,6 +246,26 @@ class Battlefield:
         return None
 
 
+def combat(board):
+    completed_rounds = 0
+    try:
+        while True:
+            board.tick()
+            completed_rounds += 1
+    except DeadElf:
+        return None
+    except CombatEnd:
+        return board.survivor_hp * completed_rounds
+
+
+def elves_survive(handle, elf_atk):
+    # module level, so it can be sent to another process when probing in parallel. the map is in shared
+    # memory, so only its handle goes along with every probe
+    board = Battlefield(bytes(attach(handle)).decode().split('\n'), elf_atk)
+    board.raise_on_dead_elf = True
+    return combat(board)
+
+
 class Day15(Day):
     input: Battlefield
 
@@ -250,30 +273,18 @@ class Day15(Day):
         return Battlefield(super().parse(content))
 
     def run_combat(self, board=None):
-        if not board:
-            board = self.input
-
-        completed_rounds = 0
-        try:
-            while True:
-                board.tick()
-                completed_rounds += 1
-        except DeadElf:
-            return None
-        except CombatEnd:
-            return board.survivor_hp * completed_rounds
+        return combat(board or self.input)
 
     def part1(self):
         return self.run_combat()
 
     def part2(self):
-        # takes forever, because my search algo isn't quite optimal
-        elf_atk = 4
-
-        while True:
-            new_board = self.input.clone(elf_atk)
-            new_board.raise_on_dead_elf = True
-            result = self.run_combat(new_board)
-            if result:
-                return result
-            elf_atk += 1
+        # no bisecting here: with my input the elves survive with 20-22 attack, then lose one again
+        # up to 28. all we can do is try several values at once when there are probes to spare
+        with Shared('\n'.join(self.input._data)) as board:
+            try:
+                _, result = self.search(partial(elves_survive, board.handle), start=4, monotone=False)
+            finally:
+                # probes that ran in this process attached to it as well
+                detach(board.handle)
+        return result
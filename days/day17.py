@@ -3,6 +3,7 @@ import sys
 from collections import defaultdict
 
 from day import Day
+from utils import render
 from utils.grid import Grid
 from utils.point import UniquePoint, Point
 
@@ -60,8 +61,12 @@ class FluidGrid(Grid):
 
     def print(self, marker=None):
         # debug, but i left it in because it looks cool
+        render.defer(self.draw, marker)
+
+    def draw(self, marker=None):
+        lines = []
         for y in self.iter_y():
-            line = ''
+            line = []
             marker_in_line = False
             for x in self.iter_x():
                 point = UniquePoint(x, y)
@@ -77,11 +82,12 @@ class FluidGrid(Grid):
                 if point in self.wet:
                     item = f'\033[94m{item}\033[0m'
 
-                line += item
+                line.append(item)
             if marker_in_line:
-                line += f'  =>  {marker}'
+                line.append(f'  =>  {marker}')
 
-            print(line)
+            lines.append(''.join(line))
+        return '\n'.join(lines)
 
     def count_wet(self):
         count = 0
@@ -100,9 +106,10 @@ class FluidGrid(Grid):
 
 class Day17(Day):
     input: FluidGrid
+    requires = {2: (1,)}  # part2 counts the water that part1 filled in
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
         # we're going deep here...
         sys.setrecursionlimit(10000)
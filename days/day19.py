@@ -1,6 +1,6 @@
 from typing import List, Tuple
 
-from day import Day
+from day import Day, strategy
 from utils.computer import ALL_INSTRUCTIONS, Operation, Instruction, Computer, ComputerMixin
 
 
@@ -26,6 +26,11 @@ class AddIfModulo(Instruction):
         return [a, b, c, d, e, f]
 
 
+class AddIfModuloLoop(AddIfModulo):
+    # the original loop, still a lot quicker than running it as instructions
+    run_operation = AddIfModulo._run_operation_original
+
+
 class Day19(ComputerMixin, Day):
     input: Tuple[List[Instruction], int]
 
@@ -44,6 +49,15 @@ class Day19(ComputerMixin, Day):
 
         return computer.registers[0]
 
+    # only for part 1, the loop would take days on the numbers of part 2
+    @strategy(1, 'loop')
+    def part1_loop(self):
+        instructions = [AddIfModuloLoop() if isinstance(i, AddIfModulo) else i for i in self.input[0]]
+        computer = Computer(instructions, self.input[1])
+        computer.run()
+
+        return computer.registers[0]
+
     def part2(self):
         computer = Computer([*self.input[0]], self.input[1])
         computer.registers[0] = 1
@@ -1,9 +1,10 @@
 import re
 
 from day import Day
+from utils import render
 from utils.grid import Grid
 from utils.point import UniquePoint
-from utils.timer import Timer
+from utils.timer import Timer, span
 
 rx_collapsible = re.compile(r'(?P<start>[(|^])(?P<prefix>[NESW]+)\((?P<contents>[NESW|]+)\)')
 
@@ -27,12 +28,14 @@ class DoorGrid(Grid):
         self.min_x = x if self.min_x is None else min(self.min_x, x - 1)
         self.min_y = y if self.min_y is None else min(self.min_y, y - 1)
 
+    @span('build grid')
     def add_regex(self, rx_input):
         start = UniquePoint(1000, 1000)
 
         self._solve_path(start, rx_input)
         self[start] = 'X'
 
+    @span('bfs')
     def _resolve_paths(self):
         start = UniquePoint(1000, 1000)
 
@@ -84,7 +87,7 @@ class DoorGrid(Grid):
         paths = self._collapse_paths(paths)
 
         t = Timer()
-        print(f'checking out {len(paths)} paths')
+        render.write(f'checking out {len(paths)} paths')
         for path in paths:
             location = start
             for step in path:
@@ -114,8 +117,10 @@ class DoorGrid(Grid):
 
 class Day20(Day):
     grid: DoorGrid
+    requires = {2: (1,)}  # part2 counts the rooms of the grid part1 built
 
     def part1(self):
+        # building the grid is most of the work, and belongs to the timing of the part doing it
         self.grid = DoorGrid()
         self.grid.add_regex(self.input[0])
         return self.grid.find_furthest_point()
@@ -1,6 +1,5 @@
-from functools import lru_cache
-
 from day import Day
+from utils import counters, render
 from utils.colors import color, BLUE, RED, YELLOW, MAGENTA, GREEN
 from utils.grid import Grid
 from utils.point import UniquePoint, ZERO
@@ -23,6 +22,7 @@ class ErosionGrid(Grid):
         self.target = target
 
         self._debug_travel = None
+        self._types = {}
 
     def _get_erosion_level(self, point):
         if point == ZERO or point == self.target:
@@ -48,18 +48,22 @@ class ErosionGrid(Grid):
         return value
 
     def print(self):
+        render.defer(self.draw)
+
+    def draw(self):
         visited = set([p[0] for p in self._debug_travel.keys()]) if self._debug_travel else set()
 
+        lines = []
         for y in self.iter_y():
-            line = ''
+            line = []
             for x in self.iter_x():
                 point = UniquePoint(x, y)
                 value = self[point] % 3
 
                 if point == ZERO:
-                    line += color('M', BLUE)
+                    line.append(color('M', BLUE))
                 elif point == self.target:
-                    line += color('T', RED)
+                    line.append(color('T', RED))
                 elif point in visited:
                     if self._debug_travel.get((point, TOOL_CLIMB)):
                         use_color = MAGENTA
@@ -71,18 +75,19 @@ class ErosionGrid(Grid):
                         use_color = GREEN
                         use_tool = TOOL_NONE
 
-                    line += color(self._debug_travel[(point, use_tool)], use_color)
+                    line.append(color(self._debug_travel[(point, use_tool)], use_color))
 
                 elif value == 0:
-                    line += '.'
+                    line.append('.')
                 elif value == 1:
-                    line += '='
+                    line.append('=')
                 elif value == 2:
-                    line += '|'
+                    line.append('|')
                 else:
-                    line += '?'
+                    line.append('?')
 
-            print(line)
+            lines.append(''.join(line))
+        return '\n'.join(lines)
 
     def fill(self):
         for y in range(self.target.y + 1):
@@ -90,9 +95,12 @@ class ErosionGrid(Grid):
                 point = UniquePoint(x, y)
                 self[point] = self._get_erosion_level(point)
 
-    @lru_cache
     def _type(self, point):
-        return self[point] % 3
+        # hot in the path finding, a plain dict on the grid is about as cheap as a cache gets
+        terrain = self._types.get(point)
+        if terrain is None:
+            terrain = self._types[point] = self[point] % 3
+        return terrain
 
     def _rollback(self, prev, end, result=None):
         if not result:
@@ -124,6 +132,8 @@ class ErosionGrid(Grid):
                 return g_score[(location, tool)]
 
             queue.remove(current_item)
+            counters.incr('day22.nodes_expanded')
+            counters.observe('day22.queue_size', len(queue))
             for next_item in self.next_possible(location, tool):
                 next_cost, next_point, next_tool = next_item
 
@@ -3,6 +3,7 @@ import re
 from typing import List
 
 from day import Day
+from utils.inputs import LINES
 
 
 class NanoBot:
@@ -105,6 +106,7 @@ class Cube:
 
 class Day23(Day):
     input: List[NanoBot]
+    input_mode = LINES
 
     def parse(self, content):
         bots = []
@@ -131,9 +133,9 @@ class Day23(Day):
         return total_in_range
 
     def check_cubes(self, cubes):
-        max_in_range = 0
-
         while True:
+            # smaller cubes can have fewer bots in range than the level before, so every level starts over
+            max_in_range = 0
             cube = None
             at_max = []
 
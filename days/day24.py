@@ -1,7 +1,9 @@
 import copy
 import re
+from functools import partial
+from itertools import count
 
-from day import Day
+from day import Day, strategy
 from utils.timer import Timer
 
 rx_units = r''
@@ -216,6 +218,16 @@ class BattleSimulation:
             #print(self)
 
 
+def immune_system_wins(armies, boost):
+    sim = BattleSimulation(copy.deepcopy(armies))
+    sim.armies[0].boost(boost)
+    winner = sim.run()
+
+    if winner and winner.name != 'Infection':
+        return winner.unit_count
+    return None
+
+
 class Day24(Day):
 
     def parse(self, content):
@@ -233,15 +245,15 @@ class Day24(Day):
         print(f'{winner.name} wins')
         return winner.unit_count
 
-    def part2(self):
-        boost = 0
-
-        while True:
-            sim = BattleSimulation(copy.deepcopy(self.input))
-            sim.armies[0].boost(boost)
-            winner = sim.run()
-
-            if winner and winner.name != 'Infection':
-                return winner.unit_count
+    @strategy(2, 'linear')
+    def part2_linear(self):
+        # every boost in turn, the search has to find the same one
+        for boost in count():
+            result = immune_system_wins(self.input, boost)
+            if result is not None:
+                return result
 
-            boost += 1
+    def part2(self):
+        # a bigger boost should only help, apart from the odd draw. those are what verify is for
+        _, result = self.search(partial(immune_system_wins, self.input), verify=3)
+        return result
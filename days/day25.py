@@ -1,7 +1,10 @@
 from day import Day
+from utils.inputs import LINES
 
 
 class Day25(Day):
+    input_mode = LINES
+
     def parse(self, content):
         return [tuple(int(i) for i in line.split(',')) for line in super().parse(content)]
 
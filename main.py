@@ -1,27 +1,144 @@
-import sys
+import argparse
 
-from days import get_days
+from day import PARTS
+from days import select_days
+from utils import counters, memo, render, timer
+from utils.cache import ParsedCache, ResultCache
 
 
-def run_day(index=None):
-    if index is None:
-        index = -1
+def run_day(selection=None, parts=PARTS, parallel=False, workers=None, use_cache=True, cache_parsed=False, timeout=None,
+            inputs=None, stream=False, watch=False, history=None, **options):
+    parsed_cache = ParsedCache() if cache_parsed else None
+    selected = select_days(selection)
 
-    if isinstance(index, str) and index != 'all':
-        index = int(index) - 1
+    strategy = options.get('strategy')
+    if strategy and not any(strategy in day.strategies(part) for day in selected for part in parts):
+        raise ValueError(f'None of the selected parts has a strategy "{strategy}"')
 
-    days = get_days()
-    days.sort(key=lambda x: x.__name__)
+    if watch:
+        if len(selected) != 1:
+            raise ValueError('--watch needs a single day')
 
-    if index == 'all':
-        for day in days:
-            day().run()
+        from utils.watch import watch
+        watch(selected[0], parts, timeout, **options)
+        return
+
+    if inputs:
+        if len(selected) != 1:
+            raise ValueError('--inputs needs a single day')
+
+        from utils.batch import run_batch
+        run_batch(selected[0], inputs, parts, workers=workers, use_cache=use_cache, parsed_cache=parsed_cache,
+                  timeout=timeout, **options)
+        return
+
+    if stream:
+        import asyncio
+        from utils.aio import print_events
+        asyncio.run(print_events(
+            selected, parts=parts, workers=workers, use_cache=use_cache, parsed_cache=parsed_cache, timeout=timeout,
+            **options,
+        ))
+    elif parallel:
+        from utils.parallel import run_parallel
+        run_parallel(selected, workers, use_cache, parsed_cache, timeout, parts=parts, history=history, **options)
     else:
-        days[index]().run()
+        cache = ResultCache() if use_cache else None
+        for day in selected:
+            day(parsed_cache).run(cache, timeout, parts, history=history, **options)
 
 
 if __name__ == '__main__':
-    if len(sys.argv) == 2:
-        run_day(sys.argv[1])
-    else:
-        run_day()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('day', nargs='?', help='days to run, like 15, 1-5,9 or "all", defaults to the latest day')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run this part')
+    parser.add_argument('--parallel', action='store_true', help='spread days and their parts over a process pool')
+    parser.add_argument('--stream', action='store_true', help='like --parallel, but print every part as soon as it is done')
+    parser.add_argument('--workers', type=int, help='size of the process pool, defaults to the number of CPUs')
+    parser.add_argument('--watch', action='store_true', help='run again whenever the day or utils/ change')
+    parser.add_argument('--inputs', metavar='DIR', help='solve the day for every file in DIR, printing JSON lines')
+    parser.add_argument('--serve', metavar='SOCKET', nargs='?', const=True, help='keep running and answer client.py')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not update the result cache')
+    parser.add_argument('--cache-parsed', action='store_true', help='reuse parsed inputs from previous runs')
+    parser.add_argument('--memo-disk', action='store_true', help='let memoized helpers reuse results of earlier runs')
+    parser.add_argument('--accounting', action='store_true', help='report cpu time, memory and gc activity per part')
+    parser.add_argument('--quiet', action='store_true', help='do not render grids and other visual output')
+    parser.add_argument('--render-to', metavar='FILE', help='append visual output to FILE instead of printing it')
+    parser.add_argument('--counters', action='store_true', help='report the work counted by the solvers per part')
+    parser.add_argument('--strategy', help='solve parts that have it with this strategy instead, see compare.py')
+    parser.add_argument('--probes', type=int, help='candidates a parameter search tries at once, in processes')
+    parser.add_argument('--timeout', type=float, help='seconds a single part may take before it gets cancelled')
+    parser.add_argument('--profile', action='store_true', help='profile each part, results end up in profiles/')
+    parser.add_argument('--profile-top', type=int, default=15, help='number of hot functions to list when profiling')
+    parser.add_argument('--trace', metavar='FILE', help='write spans as chrome trace JSON (chrome://tracing, perfetto)')
+    parser.add_argument('--no-history', action='store_true', help='do not record timings, nor schedule by them')
+    parser.add_argument('--history', action='store_true', help='list parts that got slower than they used to be')
+    parser.add_argument('--noise', type=float, default=0.2, help='how much slower counts as a regression, 0.2 = 20%%')
+    args = parser.parse_args()
+
+    if args.history:
+        from utils.history import report
+        raise SystemExit(1 if report(args.noise) else 0)
+
+    if args.serve:
+        from utils.daemon import DEFAULT_SOCKET, serve
+        serve(DEFAULT_SOCKET if args.serve is True else args.serve)
+        raise SystemExit
+
+    sink = None
+    if args.quiet:
+        sink = render.NullSink()
+    elif args.render_to:
+        sink = render.FileSink(args.render_to)
+    if sink:
+        render.use(sink)
+
+    if args.trace:
+        timer.enable_tracing()
+    if args.counters:
+        counters.enable()
+
+    # instrumented timings are no timings to compare against, they still help scheduling though.
+    # neither are those of another strategy, and its results better not come from the cache
+    measuring = args.accounting or args.profile or args.trace or args.counters or args.strategy
+    if args.memo_disk:
+        if measuring:
+            parser.error('--memo-disk would measure loading memoized results, not the work')
+        memo.use_disk()
+
+    history = None
+    if not args.no_history:
+        from utils.history import History
+        # nor are those of runs reusing memoized results
+        history = History(record=not (measuring or args.memo_disk))
+
+    try:
+        select_days(args.day)
+    except ValueError as error:
+        parser.error(str(error))
+
+    run_day(
+        args.day,
+        # parts others build on still run, or their state comes from the cache
+        parts=sorted(set(args.part)) if args.part else PARTS,
+        parallel=args.parallel,
+        workers=args.workers,
+        # cached results have nothing to measure
+        use_cache=not (args.no_cache or measuring),
+        cache_parsed=args.cache_parsed,
+        timeout=args.timeout,
+        inputs=args.inputs,
+        stream=args.stream,
+        watch=args.watch,
+        history=history,
+        accounting=args.accounting,
+        profile=args.profile_top if args.profile else None,
+        trace=bool(args.trace),
+        counters=args.counters,
+        probes=args.probes,
+        sink=sink,
+        strategy=args.strategy,
+    )
+
+    if args.trace:
+        print(f'Wrote {timer.export(args.trace)} spans to {args.trace}')
@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import tempfile
+
+from day import PARTS, OK
+from days import get_day
+from utils.generators import generate
+from utils.supervisor import supervise
+
+BAR_WIDTH = 30
+
+
+def run(day, parts, timeout, accounting):
+    if timeout:
+        return list(supervise(day, parts, timeout, accounting=accounting))
+    return list(day.solve_parts(parts, capture=True, accounting=accounting))
+
+
+def measure(day_class, file_name, parts, timeout, memory):
+    # timing and memory come from separate runs, tracemalloc slows everything down considerably
+    timed = run(day_class(input_file=file_name), parts, timeout, accounting=False)
+    measured = {}
+    if memory:
+        measured = {
+            result.part: result for result in run(day_class(input_file=file_name), parts, timeout, accounting=True)
+        }
+
+    rows = []
+    for result in timed:
+        traced = measured.get(result.part)
+        rows.append({
+            'part': result.part,
+            'status': result.status,
+            'elapsed': result.elapsed,
+            'peak': traced.stats['traced_peak'] if traced and traced.status == OK else None,
+            'result': repr(result.result) if result.status == OK else None,
+        })
+    return rows
+
+
+def bar(value, largest):
+    if not value or not largest:
+        return ''
+    return '#' * max(round(value / largest * BAR_WIDTH), 1)
+
+
+def chart(number, part, rows):
+    # one chart per part, time and memory next to each other
+    largest_time = max((row['elapsed'] for row in rows if row['status'] == OK), default=0)
+    largest_peak = max((row['peak'] or 0 for row in rows), default=0)
+
+    print(f'Day{number:02} part {part}')
+    print(f'  {"scale":>6} {"size":>10} {"seconds":>9} {"":{BAR_WIDTH}} {"peak MB":>9}')
+    for row in rows:
+        seconds = f'{row["elapsed"]:9.3f}' if row['status'] == OK else f'{row["status"]:>9}'
+        peak = f'{row["peak"] / 1024 ** 2:9.2f}' if row['peak'] is not None else f'{"-":>9}'
+        elapsed = row['elapsed'] if row['status'] == OK else None
+        print(
+            f'  {row["scale"]:>5}x {row["size"]:>10} {seconds} {bar(elapsed, largest_time):{BAR_WIDTH}} '
+            f'{peak} {bar(row["peak"], largest_peak)}'
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='run a day on generated inputs of growing size')
+    parser.add_argument('day', type=int, help='the day to scale')
+    parser.add_argument('--scales', type=float, nargs='+', default=[0.25, 0.5, 1, 2, 4], help='input sizes to try')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append', help='only run this part')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the generator')
+    parser.add_argument('--timeout', type=float, help='give up on a part after this many seconds')
+    parser.add_argument('--no-memory', action='store_true', help='skip the (slow) memory measurement')
+    parser.add_argument('--keep', help='write the generated inputs to this directory instead of a temporary one')
+    parser.add_argument('-o', '--output', help='also write the measurements to this JSON file')
+    args = parser.parse_args()
+
+    day_class = get_day(args.day)
+    parts = args.part or PARTS
+    rows = {part: [] for part in parts}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.keep or tmp
+        os.makedirs(directory, exist_ok=True)
+
+        for scale in args.scales:
+            content = generate(args.day, scale, args.seed)
+            file_name = os.path.join(directory, f'day{args.day:02}_x{scale:g}.txt')
+            with open(file_name, 'w') as f:
+                f.write(content)
+
+            for row in measure(day_class, file_name, parts, args.timeout, not args.no_memory):
+                row.update(scale=f'{scale:g}', size=len(content))
+                rows[row['part']].append(row)
+
+    for part in parts:
+        chart(args.day, part, rows[part])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'day': args.day, 'seed': args.seed, 'results': rows}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
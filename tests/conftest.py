@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+solved_key = pytest.StashKey()
+executor_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    parser.addoption('--slow', action='store_true', help='also run the parts that take minutes')
+    parser.addoption('--workers', type=int, default=os.cpu_count(), help='parts solved at the same time')
+    parser.addoption('--budget-factor', type=float, default=1.0, help='scales all budgets, e.g. for slower machines')
+
+
+def solve(day, part, timeout):
+    # a fresh interpreter per part, so its peak memory is its own
+    try:
+        completed = subprocess.run(
+            [sys.executable, '-m', 'tests.solve_part', str(day), str(part)],
+            cwd=ROOT, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {'timeout': timeout}
+
+    if completed.returncode:
+        return {'error': completed.stderr}
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def pytest_collection_modifyitems(config, items):
+    # everything selected starts solving right away, the tests then just wait for their part in order
+    executor = ThreadPoolExecutor(config.getoption('workers'))
+    config.stash[executor_key] = executor
+    config.stash[solved_key] = solved = {}
+    factor = config.getoption('budget_factor')
+
+    for item in items:
+        if item.get_closest_marker('slow') and not config.getoption('slow'):
+            item.add_marker(pytest.mark.skip(reason='takes minutes, run with --slow'))
+            continue
+
+        params = getattr(item, 'callspec', None) and item.callspec.params
+        if params and 'expected' in params:
+            # way past the budget the test fails anyway, no need to wait for it
+            timeout = params['expected']['seconds'] * factor * 3 + 10
+            solved[item.nodeid] = executor.submit(solve, params['day'], params['part'], timeout)
+
+
+def pytest_unconfigure(config):
+    # parts of tests that never ran (-x, ctrl-c) don't need to be solved anymore
+    for future in config.stash.get(solved_key, {}).values():
+        future.cancel()
+
+    executor = config.stash.get(executor_key, None)
+    if executor:
+        executor.shutdown(wait=False)
+
+
+@pytest.fixture
+def solved(request):
+    return request.config.stash[solved_key][request.node.nodeid].result()
+
+
+@pytest.fixture
+def budget_factor(request):
+    return request.config.getoption('budget_factor')
@@ -0,0 +1,35 @@
+"""
+solves a single part in a fresh interpreter and prints the outcome as JSON, so memory can be measured per part:
+    python -m tests.solve_part <day> <part>
+"""
+import json
+import sys
+import time
+
+from days import get_day
+from utils.accounting import process_max_rss
+
+
+def main():
+    number, part = int(sys.argv[1]), int(sys.argv[2])
+    day = get_day(number)()
+
+    # parsing is not part of the part's own timing, but counts towards the budget
+    start = time.perf_counter()
+    day.input
+    setup = time.perf_counter() - start
+
+    # parts this one builds on run as well, but only the requested one is timed
+    result, = day.solve_parts([part], capture=True)
+
+    print(json.dumps({
+        'result': str(result.result),
+        'elapsed': result.elapsed,
+        'setup': setup,
+        # parsing and the parts this one builds on count towards the budget as well
+        'max_rss': process_max_rss(),
+    }))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+import sys
+
+from days import get_day
+from utils.cache import _local_modules
+
+
+def test_cache_key_covers_the_modules_a_day_uses():
+    modules = _local_modules(sys.modules[get_day(22).__module__])
+    # directly, through `from x import y`, and through day.py
+    assert {'days.day22', 'day', 'utils.grid', 'utils.point', 'utils.cache'} <= modules.keys()
+    # neither other days nor the standard library
+    assert not [name for name in modules if name.startswith('days.') and name != 'days.day22']
+    assert 'functools' not in modules
@@ -0,0 +1,47 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from utils.daemon import request, serve
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = str(tmp_path / 'solver.sock')
+    thread = threading.Thread(target=serve, args=(path,), daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            request({}, path)
+            break
+        except (FileNotFoundError, ConnectionRefusedError):
+            assert time.monotonic() < deadline, 'the solver never started listening'
+            time.sleep(0.1)
+
+    yield path
+    request({'stop': True}, path)
+    thread.join(10)
+
+
+def send(path, data):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(data)
+        connection.shutdown(socket.SHUT_WR)
+        return connection.makefile('rb').readline()
+
+
+@pytest.mark.parametrize('data', [b'', b'garbage\n', b'[1]\n', b'{}\n', b'{"day": 99}\n'])
+def test_bad_requests_get_an_error(server, data):
+    assert b'"error"' in send(server, data)
+    assert request({'day': 1, 'parts': [1]}, server)['parts']['1']['result'] == '529'
+
+
+def test_clients_leaving_early(server):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(server)
+    assert request({'day': 1, 'parts': [1]}, server)['parts']['1']['result'] == '529'
@@ -0,0 +1,20 @@
+from day import OK
+from days.day23 import Day23
+from utils.supervisor import supervise
+
+# the best cube of the second level has fewer bots in range than the best of the first, which used to leave
+# no cube to look at and loop forever
+BOTS = [
+    'pos=<6,11,-4>, r=2',
+    'pos=<-1,1,-19>, r=2',
+    'pos=<10,-20,-13>, r=5',
+]
+
+
+def test_finer_cubes_with_fewer_bots_in_range(tmp_path):
+    input_file = tmp_path / 'day23.txt'
+    input_file.write_text('\n'.join(BOTS))
+
+    result, = supervise(Day23(input_file=str(input_file)), [2], 10)
+    assert result.status == OK
+    assert result.result == 19
@@ -0,0 +1,32 @@
+import json
+import os
+
+import pytest
+
+with open(os.path.join(os.path.dirname(__file__), 'golden.json')) as f:
+    GOLDEN = json.load(f)
+
+CASES = [
+    pytest.param(
+        int(day), int(part), expected,
+        marks=[pytest.mark.slow] if expected.get('slow') else [],
+        id=f'day{int(day):02}-part{part}',
+    )
+    for day, parts in GOLDEN.items()
+    for part, expected in parts.items()
+]
+
+
+@pytest.mark.parametrize('day, part, expected', CASES)
+def test_part(day, part, expected, solved, budget_factor):
+    assert 'timeout' not in solved, f'gave up after {solved.get("timeout")}s'
+    assert 'error' not in solved, solved.get('error')
+    assert solved['result'] == expected['answer']
+
+    seconds = expected['seconds'] * budget_factor
+    elapsed = solved['setup'] + solved['elapsed']
+    assert elapsed <= seconds, f'took {elapsed:.2f}s, the budget is {seconds:.2f}s'
+
+    megabytes = expected['megabytes'] * budget_factor
+    max_rss = solved['max_rss'] / 1024 ** 2
+    assert max_rss <= megabytes, f'peaked at {max_rss:.1f}MB, the budget is {megabytes:.1f}MB'
@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from day import ERROR, OK, PartResult
+from utils import history
+from utils.history import History
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    # runs recorded in quick succession must still come out in order
+    clock = itertools.count(1000)
+    monkeypatch.setattr(history.time, 'time', lambda: next(clock))
+    monkeypatch.setattr(history, 'revision', lambda: 'test')
+    recorded = History(str(tmp_path / 'history.sqlite'))
+
+    def add(day, part, *timings, status=OK):
+        for elapsed in timings:
+            recorded.add(PartResult(day, part, elapsed=elapsed, status=status))
+    return recorded, add
+
+
+def test_regressions(recorded):
+    recorded, add = recorded
+    add('Day01', 1, 1.0, 1.1, 0.9, 1.0, 1.5)
+    add('Day01', 2, 2.0, 2.1, 1.9, 2.0, 2.1)
+    # way slower in percent, but still well within what counts as noise
+    add('Day02', 1, 0.001, 0.001, 0.001, 0.005)
+
+    assert list(recorded.regressions()) == [
+        ('Day01', 1, 1.5, 1.0, True),
+        ('Day01', 2, 2.1, 2.0, False),
+        ('Day02', 1, 0.005, 0.001, False),
+    ]
+    assert [regressed for *_, regressed in recorded.regressions(threshold=0.6)] == [False, False, False]
+
+
+def test_regressions_window(recorded):
+    recorded, add = recorded
+    # only the `window` runs before the latest count towards its median
+    add('Day01', 1, 5.0, 5.0, 5.0, 1.0, 1.0, 1.2)
+    assert list(recorded.regressions(window=2)) == [('Day01', 1, 1.2, 1.0, False)]
+    assert list(recorded.regressions(window=5)) == [('Day01', 1, 1.2, 5.0, False)]
+
+
+def test_regressions_need_two_finished_runs(recorded):
+    recorded, add = recorded
+    add('Day01', 1, 1.0)
+    add('Day01', 1, 9.0, status=ERROR)
+    assert list(recorded.regressions()) == []
+
+
+def test_cached_results_are_not_recorded(recorded):
+    recorded, _ = recorded
+    cached = PartResult('Day01', 1, elapsed=0.0)
+    cached.cached = True
+    recorded.add(cached)
+    assert recorded.timings('Day01', 1) == []
+
+
+def test_nothing_recorded_without_record(tmp_path):
+    unrecorded = History(str(tmp_path / 'history.sqlite'), record=False)
+    unrecorded.add(PartResult('Day01', 1, elapsed=1.0))
+    assert unrecorded.timings('Day01', 1) == []
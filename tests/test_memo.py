@@ -0,0 +1,66 @@
+from utils.memo import clear_all, memo
+
+
+def test_memo_evicts_the_least_recently_used():
+    calls = []
+
+    @memo(maxsize=2)
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    assert [double(1), double(2), double(1), double(3)] == [2, 4, 2, 6]
+    assert calls == [1, 2, 3]
+
+    # 2 was used longest ago when 3 came in, 1 had just been asked for again
+    assert double(1) == 2
+    assert double(2) == 4
+    assert calls == [1, 2, 3, 2]
+    assert double.stats() == {'hits': 2, 'disk_hits': 0, 'misses': 4, 'size': 2, 'maxsize': 2}
+
+
+def test_memo_key():
+    calls = []
+
+    class Grid:
+        def __init__(self, depth):
+            self.depth = depth
+
+        @memo(key=lambda self, point: (self.depth, point))
+        def level(self, point):
+            calls.append(point)
+            return self.depth + point
+
+    # another grid of the same depth gets the same results, one of another depth does not
+    assert Grid(10).level(1) == 11
+    assert Grid(10).level(1) == 11
+    assert Grid(20).level(1) == 21
+    assert calls == [1, 1]
+
+
+def test_memo_cache_clear():
+    calls = []
+
+    @memo()
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    square(3)
+    square.cache_clear()
+    square(3)
+    assert calls == [3, 3]
+
+
+def test_memo_clear_all():
+    calls = []
+
+    @memo()
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    square(3)
+    clear_all()
+    square(3)
+    assert calls == [3, 3]
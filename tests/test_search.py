@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.search import first, scan
+
+
+def from_37(value):
+    return value * 2 if value >= 37 else None
+
+
+def with_dip(value):
+    # like day15's elves: they win from 20, lose again from 23 to 28 and win for good from 29
+    return value if 20 <= value <= 22 or value >= 29 else None
+
+
+def counted(predicate):
+    calls = []
+
+    def wrapper(value):
+        calls.append(value)
+        return predicate(value)
+    return wrapper, calls
+
+
+def test_first_finds_the_smallest_value():
+    predicate, calls = counted(from_37)
+    assert first(predicate) == (37, 74)
+    # galloping and bisecting, not trying everything below
+    assert len(calls) < 20
+    assert len(calls) == len(set(calls))
+
+
+def test_first_starts_at_start():
+    assert first(from_37, start=40) == (40, 80)
+    assert first(from_37, start=37) == (37, 74)
+
+
+def test_first_with_probes():
+    with ThreadPoolExecutor(3) as executor:
+        assert first(from_37, probes=3, executor=executor) == (37, 74)
+    # without an executor the probes are tried one after another
+    assert first(from_37, probes=3) == (37, 74)
+
+
+def test_first_misses_a_dip_wider_than_verify():
+    # bisecting lands on 29, and 28 right below it has no result. why day15 scans instead
+    assert first(with_dip, start=4) == (29, 29)
+
+
+def test_first_verifies_down_over_a_dip():
+    predicate, calls = counted(with_dip)
+    assert first(predicate, start=4, verify=9) == (20, 20)
+    # walking down stops once nothing below has a result
+    assert min(calls) >= 4
+
+
+def test_scan_finds_the_first_of_a_dip():
+    assert scan(with_dip, start=4) == (20, 20)
+    assert scan(with_dip, start=23) == (29, 29)
+
+
+def test_scan_with_probes():
+    with ThreadPoolExecutor(4) as executor:
+        assert scan(with_dip, start=4, probes=4, executor=executor) == (20, 20)
+    assert scan(with_dip, start=4, probes=4) == (20, 20)
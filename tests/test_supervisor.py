@@ -0,0 +1,53 @@
+import os
+import time
+
+import pytest
+
+from day import TIMEOUT
+from days.day05 import Day05
+from utils.supervisor import supervise
+
+SHM_DIR = '/dev/shm'
+
+
+def processes():
+    # pid -> (process group, state) of everything still around
+    found = {}
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                stat = f.read()
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+        # the command in parentheses may contain anything, the fields after it don't
+        fields = stat[stat.rindex(')') + 2:].split()
+        found[int(pid)] = int(fields[2]), fields[0]
+    return found
+
+
+def segments():
+    return {name for name in os.listdir(SHM_DIR) if name.startswith('psm_')}
+
+
+@pytest.mark.skipif(not os.path.isdir(SHM_DIR) or not hasattr(os, 'killpg'), reason='needs /proc and /dev/shm')
+def test_timeout_stops_the_pool_of_a_part():
+    before = processes()
+    segments_before = segments()
+
+    # day05 part2 runs a process pool on its polymer in shared memory, and takes longer than this
+    result, = supervise(Day05(), [2], 2)
+    assert result.status == TIMEOUT
+
+    # anything started since in a group of its own was the child or its pool. zombies are dead already,
+    # they just wait for init to notice
+    deadline = time.monotonic() + 5
+    while True:
+        left = [
+            pid for pid, (group, state) in processes().items()
+            if pid not in before and group != os.getpgrp() and state != 'Z'
+        ]
+        if not left or time.monotonic() > deadline:
+            break
+        time.sleep(0.1)
+    assert left == []
+    assert segments() - segments_before == set()
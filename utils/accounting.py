@@ -0,0 +1,135 @@
+import gc
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    # not available on windows, we just skip the rss then
+    resource = None
+
+_earlier_peak = 0  # the highest max_rss() before it was last reset
+
+
+def _mb(value):
+    return f'{value / 1024 / 1024:.2f}MB'
+
+
+def reset_max_rss():
+    # lets max_rss() start over from the current rss, so it tells the peak of a part instead of the highest
+    # one of everything this process ran before. only linux can, returns whether it did
+    global _earlier_peak
+    _earlier_peak = max(_earlier_peak, max_rss() or 0)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def max_rss():
+    # in bytes, the most this process used since it started, or since reset_max_rss().
+    # linux's getrusage keeps the high-water mark of whatever exec'd into this process (like a big pytest),
+    # VmHWM is only our own
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if not resource:
+        return None
+    # kilobytes on linux, bytes on macos
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+def process_max_rss():
+    # the most this process ever used, resets or not
+    current = max_rss()
+    return max(_earlier_peak, current) if current is not None else None
+
+
+class Accounting:
+    # how often the sampler checks whether the traced memory reached a new high, and by how much it
+    # has to grow before we take another snapshot (snapshots of big heaps are expensive)
+    interval = 0.1
+    growth = 1.25
+
+    def __init__(self, top=5):
+        self.top = top
+        self.stats = {}
+
+        self._snapshot = None
+        self._snapshot_size = 0
+        self._done = threading.Event()
+        self._sampler = None
+        self._cpu = 0
+        self._gc = []
+        self._own_peak = False
+
+    def _sample(self):
+        # the locals of a part are gone once it returns, so the allocation sites are captured
+        # whenever the traced memory reaches a new high while the part is still running
+        while not self._done.wait(self.interval):
+            self._take_snapshot()
+
+    def _take_snapshot(self, growth=None):
+        import tracemalloc
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._snapshot_size * (growth or self.growth):
+            self._snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+            ])
+            self._snapshot_size = current
+
+    def __enter__(self):
+        # tracemalloc drags in fnmatch and re, imported only when a part is actually accounted
+        import tracemalloc
+        self._own_peak = reset_max_rss()
+        self._gc = [stat['collections'] for stat in gc.get_stats()]
+        tracemalloc.start()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *_):
+        import tracemalloc
+        cpu = time.process_time() - self._cpu
+        self._done.set()
+        self._sampler.join()
+
+        self._take_snapshot(growth=1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        allocations = []
+        if self._snapshot:
+            cwd = os.getcwd()
+            for stat in self._snapshot.statistics('lineno')[:self.top]:
+                frame = stat.traceback[0]
+                allocations.append((os.path.relpath(frame.filename, cwd), frame.lineno, stat.size, stat.count))
+
+        self.stats = {
+            'cpu': cpu,
+            # without a reset it would be the peak of whatever ran before as well
+            'max_rss': max_rss() if self._own_peak else None,
+            'traced_peak': peak,
+            'top_allocations': allocations,
+            'gc_collections': [stat['collections'] - before for stat, before in zip(gc.get_stats(), self._gc)],
+        }
+
+
+def report(stats):
+    max_rss = _mb(stats['max_rss']) if stats['max_rss'] is not None else 'n/a'
+    collections = '/'.join(str(count) for count in stats['gc_collections'])
+    print(f'  cpu: {stats["cpu"]:.3f}s, peak rss of the part: {max_rss}, traced peak: {_mb(stats["traced_peak"])}, gc: {collections}')
+
+    for file_name, line, size, count in stats['top_allocations']:
+        print(f'    {file_name}:{line} {_mb(size)} in {count} blocks')
@@ -0,0 +1,61 @@
+import asyncio
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from day import OK, PARTS
+from utils.parallel import _solve
+
+
+class Event(namedtuple('Event', 'day part result timing')):
+    # unpacks as (day, part, result, timing), `status` says whether the part finished at all
+    status = OK
+
+    @classmethod
+    def from_result(cls, part_result):
+        event = cls(part_result.day, part_result.part, part_result.result, part_result.elapsed)
+        event.status = part_result.status
+        return event
+
+
+async def stream(days, workers=None, concurrency=None, use_cache=True, parsed_cache=None, timeout=None, parts=PARTS,
+                 **options):
+    """
+    solves the days on a process pool and yields an Event for every part as soon as it is done, no matter
+    which day it belongs to. at most `concurrency` jobs are handed to the pool at a time.
+    closing the generator or cancelling the task consuming it drops everything that has not started yet,
+    parts that already run are only stopped by a `timeout`.
+    """
+    workers = workers or os.cpu_count()
+    limit = asyncio.Semaphore(concurrency or workers)
+    executor = ProcessPoolExecutor(workers)
+    submitted = []
+
+    async def job(day, group):
+        async with limit:
+            future = executor.submit(
+                _solve, day.__module__, day.__name__, group, use_cache, parsed_cache, timeout, options,
+            )
+            submitted.append(future)
+            return await asyncio.wrap_future(future)
+
+    jobs = [asyncio.ensure_future(job(day, group)) for day in days for group in day.groups(parts)]
+    try:
+        for done in asyncio.as_completed(jobs):
+            for result in await done:
+                yield Event.from_result(result)
+    finally:
+        for pending in jobs:
+            pending.cancel()
+        # what the pool has not started yet, by hand: shutdown(cancel_futures=True) needs python 3.9
+        for future in submitted:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def print_events(days, **kwargs):
+    async for event in stream(days, **kwargs):
+        if event.status == OK:
+            print(f'{event.day} part {event.part}: {event.result} ({event.timing:.3f}s)', flush=True)
+        else:
+            print(f'{event.day} part {event.part}: {event.status}', flush=True)
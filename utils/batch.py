@@ -0,0 +1,86 @@
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from day import PARTS, OK
+from utils.cache import ResultCache
+from utils.supervisor import supervise
+
+# the day class, imported once per worker by _init
+_day_class = None
+
+
+def _init(module, name):
+    global _day_class
+    _day_class = getattr(importlib.import_module(module), name)
+
+
+def _json(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def _solve_file(file_name, parts, use_cache, parsed_cache, timeout, options):
+    day = _day_class(parsed_cache, file_name)
+    cache = ResultCache() if use_cache else None
+    start = time.perf_counter()
+
+    try:
+        if timeout:
+            results = list(supervise(day, parts, timeout, cache=cache, **options))
+        else:
+            results = list(day.solve_parts(parts, cache, capture=True, **options))
+    except Exception as e:
+        # a broken input should not take the whole batch down
+        return {'input': file_name, 'error': f'{e.__class__.__name__}: {e}', 'elapsed': time.perf_counter() - start}
+
+    return {
+        'input': file_name,
+        'elapsed': time.perf_counter() - start,
+        'parts': {
+            result.part: {
+                'status': result.status,
+                'result': _json(result.result),
+                'elapsed': result.elapsed,
+                'cached': result.cached,
+            }
+            for result in results
+        },
+    }
+
+
+def run_batch(day_class, directory, parts=PARTS, workers=None, use_cache=True, parsed_cache=None, timeout=None,
+              **options):
+    """
+    solves every file in `directory` with `day_class` and writes one JSON line per input as soon as it is done.
+    the summary goes to stderr, so stdout stays valid JSON lines.
+    """
+    files = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name))
+    )
+    start = time.perf_counter()
+    failed = 0
+
+    with ProcessPoolExecutor(workers, initializer=_init, initargs=(day_class.__module__, day_class.__name__)) as executor:
+        futures = [
+            executor.submit(_solve_file, file_name, parts, use_cache, parsed_cache, timeout, options)
+            for file_name in files
+        ]
+
+        for future in as_completed(futures):
+            line = future.result()
+            if 'error' in line or any(part['status'] != OK for part in line['parts'].values()):
+                failed += 1
+            print(json.dumps(line), flush=True)
+
+    elapsed = time.perf_counter() - start
+    rate = len(files) / elapsed if elapsed else 0
+    print(
+        f'{len(files)} inputs in {elapsed:.3f}s ({rate:.2f} inputs/s), {failed} did not finish',
+        file=sys.stderr,
+    )
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import pickle
+import sys
+import types
+
+CACHE_DIR = '.cache'
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MISSING = object()
+
+
+def _local_modules(module):
+    # the modules of this repo `module` uses, directly or through others. what ended up in a namespace
+    # tells, which covers `import x` as well as `from x import y`
+    found = {module.__name__: module}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            name = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, '__module__', None)
+            used = sys.modules.get(name) if isinstance(name, str) else None
+            if used is None or name in found:
+                continue
+            if os.path.abspath(getattr(used, '__file__', None) or '').startswith(ROOT + os.sep):
+                found[name] = used
+                pending.append(used)
+    return found
+
+
+def source_hash(day):
+    # the input bytes plus the source of the day module and all of ours it uses, so editing any of them,
+    # day.py and utils/ included, invalidates the entry
+    digest = hashlib.sha256()
+
+    with open(day.input_file, 'rb') as f:
+        # chunked, inputs may be larger than we'd like to hold in memory
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    modules = _local_modules(sys.modules[day.__class__.__module__])
+    for name in sorted(modules):
+        digest.update(name.encode())
+        with open(modules[name].__file__, 'rb') as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """pickles values to files named after their key, evicting the least recently used ones above `max_size` bytes"""
+    name = 'cache'
+    default_size = 16 * 1024 * 1024
+
+    def __init__(self, path=None, max_size=None):
+        self.path = path or os.path.join(CACHE_DIR, self.name)
+        self.max_size = max_size or self.default_size
+
+    def _file(self, key):
+        return os.path.join(self.path, f'{key}.pickle')
+
+    def load(self, key):
+        file_name = self._file(key)
+        try:
+            with open(file_name, 'rb') as f:
+                value = pickle.load(f)
+            # touch the entry so eviction works least-recently-used first
+            os.utime(file_name)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return MISSING
+
+        return value
+
+    def store(self, key, value):
+        os.makedirs(self.path, exist_ok=True)
+        file_name = self._file(key)
+
+        # parallel workers may write at the same time, so write somewhere else and move it in place
+        tmp_name = f'{file_name}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_name, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # not everything can be pickled (lambdas, open files...), those just don't get cached
+            os.remove(tmp_name)
+            return False
+
+        os.replace(tmp_name, file_name)
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith('.pickle'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another worker was faster
+            total -= size
+
+
+class ResultCache(DiskCache):
+    name = 'results'
+
+    def get(self, key, part):
+        result = self.load(f'{key}.part{part}')
+        if result is MISSING:
+            return None
+
+        result.cached = True
+        return result
+
+    def put(self, key, part, result):
+        self.store(f'{key}.part{part}', result)
+
+
+class ParsedCache(DiskCache):
+    name = 'parsed'
+    default_size = 256 * 1024 * 1024
+
+
+class StateCache(DiskCache):
+    """what a day instance looks like after a part ran, for the parts that build on it"""
+    name = 'state'
+    default_size = 256 * 1024 * 1024
+
+    # set up by whoever created the day, not by its parts
+    settings = ('parsed_cache', 'input_file', 'probes')
+
+    def put(self, key, part, day):
+        state = {name: value for name, value in vars(day).items() if name not in self.settings}
+        self.store(f'{key}.part{part}', state)
+
+    def restore(self, key, part, day):
+        state = self.load(f'{key}.part{part}')
+        if state is MISSING:
+            return False
+
+        vars(day).update(state)
+        return True
@@ -1,5 +1,7 @@
 from typing import List
 
+from utils import counters
+
 
 class Operation:
     def __init__(self, raw):
@@ -260,3 +262,6 @@ class ComputerMixin:
 
         for i in range(index + 1, index + end_index):
             result[i] = NoOp()
+
+
+counters.count_calls(Computer, 'execute_instruction', 'computer.instructions')
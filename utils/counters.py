@@ -0,0 +1,95 @@
+"""
+counters and histograms for the amount of work a solver does, e.g. nodes expanded or instructions executed.
+call them as `counters.incr(...)` / `counters.observe(...)`, not imported by name: while disabled both are
+rebound to a function doing nothing. methods that are counted per call are registered with `count_calls`
+and only get wrapped while counting is enabled, so they cost nothing at all otherwise.
+"""
+import functools
+from collections import Counter
+
+_counts = Counter()
+_histograms = {}
+_wrapped = []  # (owner, attribute, counter name, original)
+_sources = []  # functions returning what was counted somewhere else since they were last asked
+_enabled = False
+
+
+def _noop(*_):
+    pass
+
+
+def _incr(name, amount=1):
+    _counts[name] += amount
+
+
+def _observe(name, value):
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = {'count': 0, 'sum': 0, 'min': value, 'max': value, 'buckets': Counter()}
+
+    histogram['count'] += 1
+    histogram['sum'] += value
+    histogram['min'] = min(histogram['min'], value)
+    histogram['max'] = max(histogram['max'], value)
+    # powers of two are precise enough to see how something grows, and keep memory flat
+    histogram['buckets'][int(value).bit_length()] += 1
+
+
+incr = _noop
+observe = _noop
+
+
+def _wrap(owner, attribute, name, original):
+    @functools.wraps(original)
+    def counted(*args, **kwargs):
+        _counts[name] += 1
+        return original(*args, **kwargs)
+
+    setattr(owner, attribute, counted)
+
+
+def count_calls(owner, attribute, name):
+    # counts calls of owner.attribute under `name`, but only while counting is enabled
+    original = getattr(owner, attribute)
+    _wrapped.append((owner, attribute, name, original))
+    if _enabled:
+        _wrap(owner, attribute, name, original)
+
+
+def enable(enabled=True):
+    global incr, observe, _enabled
+    _enabled = enabled
+    incr = _incr if enabled else _noop
+    observe = _observe if enabled else _noop
+
+    for owner, attribute, name, original in _wrapped:
+        if enabled:
+            _wrap(owner, attribute, name, original)
+        else:
+            setattr(owner, attribute, original)
+
+
+def add_source(source):
+    _sources.append(source)
+
+
+def collect():
+    # returns everything counted so far and starts over
+    for source in _sources:
+        _counts.update(source())
+    # the unary plus drops whatever a source reported as zero
+    stats = {'counts': dict(+_counts), 'histograms': {name: dict(value) for name, value in _histograms.items()}}
+    _counts.clear()
+    _histograms.clear()
+    return stats
+
+
+def report(stats):
+    for name, count in sorted(stats['counts'].items()):
+        print(f'  {name}: {count}')
+
+    for name, histogram in sorted(stats['histograms'].items()):
+        mean = histogram['sum'] / histogram['count']
+        print(f'  {name}: {histogram["count"]} values, min {histogram["min"]}, mean {mean:.1f}, max {histogram["max"]}')
+        for bucket, count in sorted(histogram['buckets'].items()):
+            print(f'    < {2 ** bucket:>10}: {count}')
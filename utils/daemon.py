@@ -0,0 +1,116 @@
+"""
+a long-lived solver that keeps the day modules imported and parsed inputs cached, answering requests
+over a unix socket. requests and responses are single JSON lines, e.g. {"day": 17, "parts": [2]}.
+nothing heavy is imported at module level, so the client side stays quick to start.
+"""
+import json
+import os
+import pickle
+import socket
+from collections import OrderedDict
+
+DEFAULT_SOCKET = '.cache/solver.sock'
+
+
+def request(message, path=DEFAULT_SOCKET):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps(message).encode() + b'\n')
+        with connection.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+class ParsedInputs:
+    """
+    parsed inputs by source hash, kept pickled: parts are free to modify their input (day17 does),
+    and unpickling a copy is still a lot cheaper than parsing again
+    """
+
+    def __init__(self, max_size=256 * 1024 ** 2):
+        self.max_size = max_size
+        self.size = 0
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return pickle.loads(self.entries[key])
+
+    def put(self, key, parsed):
+        try:
+            data = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. mmapped inputs, those are cheap to map again anyway
+            return
+
+        self.entries[key] = data
+        self.size += len(data)
+        while self.size > self.max_size and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+def _solve(message, parsed_inputs):
+    from day import PARTS
+    from days import get_day
+    from utils.cache import source_hash
+
+    day = get_day(int(message['day']))(input_file=message.get('input'))
+    key = source_hash(day)
+
+    parsed = parsed_inputs.get(key)
+    if parsed is not None:
+        day.__dict__['input'] = parsed  # where cached_property keeps it
+    else:
+        parsed_inputs.put(key, day.input)
+
+    results = day.solve_parts(message.get('parts') or PARTS, capture=True)
+    return {
+        'day': message['day'],
+        'parse_cached': parsed is not None,
+        'parts': {result.part: {'result': repr(result.result), 'elapsed': result.elapsed} for result in results},
+    }
+
+
+def serve(path=DEFAULT_SOCKET):
+    from days import get_days
+
+    # importing everything up front also compiles all the module level regexes
+    get_days()
+    parsed_inputs = ParsedInputs()
+
+    if os.path.exists(path):
+        os.remove(path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+        print(f'Listening on {path}', flush=True)
+
+        try:
+            while True:
+                connection, _ = server.accept()
+                try:
+                    with connection, connection.makefile('rwb') as stream:
+                        # one request at a time, the parts are cpu bound and redirect stdout anyway
+                        try:
+                            # whatever a client sends, it gets an answer and the next one gets served
+                            message = json.loads(stream.readline())
+                            if not isinstance(message, dict):
+                                raise ValueError('a request is a JSON object')
+                            if message.get('stop'):
+                                stream.write(b'{"stopped": true}\n')
+                                break
+                            if 'day' not in message:
+                                raise ValueError('a request needs a day')
+
+                            response = _solve(message, parsed_inputs)
+                        except Exception as e:
+                            response = {'error': f'{e.__class__.__name__}: {e}'}
+                        stream.write(json.dumps(response).encode() + b'\n')
+                except OSError:
+                    pass  # the client left without waiting for its answer
+        finally:
+            os.remove(path)
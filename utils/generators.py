@@ -0,0 +1,496 @@
+"""
+deterministic input generators, one per day. each takes a scale factor (1 is roughly the size of
+the real inputs) and a seeded Random, and returns the contents of a valid input file.
+"""
+import math
+import random
+import string
+from collections import deque
+
+from utils.computer import ALL_INSTRUCTIONS, Operation
+
+GENERATORS = {}
+
+
+def generator(number):
+    def register(func):
+        GENERATORS[number] = func
+        return func
+    return register
+
+
+def generate(number, scale=1, seed=0):
+    if number not in GENERATORS:
+        raise ValueError(f'There is no generator for day {number}')
+
+    return GENERATORS[number](scale, random.Random(seed * 100 + number))
+
+
+def _sqrt(scale):
+    # for things growing in two dimensions
+    return math.sqrt(scale)
+
+
+@generator(1)
+def day01(scale, rng):
+    changes = [rng.choice((-1, 1)) * rng.randint(1, 20) for _ in range(int(950 * scale) - 1)]
+
+    # a small total drift makes sure a frequency repeats in a reasonable number of passes
+    changes.append(rng.choice((-3, 3)) - sum(changes))
+    return '\n'.join(f'{change:+d}' for change in changes)
+
+
+@generator(2)
+def day02(scale, rng):
+    ids = [''.join(rng.choice(string.ascii_lowercase) for _ in range(26)) for _ in range(int(250 * scale) - 1)]
+
+    # exactly one pair of ids differs by a single character
+    original = rng.choice(ids)
+    index = rng.randrange(len(original))
+    replacement = rng.choice([c for c in string.ascii_lowercase if c != original[index]])
+    ids.insert(rng.randrange(len(ids)), original[:index] + replacement + original[index + 1:])
+
+    return '\n'.join(ids)
+
+
+@generator(3)
+def day03(scale, rng):
+    claims = []
+    for claim_id in range(1, int(1300 * scale) + 1):
+        w = rng.randint(10, 29)
+        h = rng.randint(10, 29)
+        x = rng.randint(0, 1000 - w)
+        y = rng.randint(0, 1000 - h)
+        claims.append(f'#{claim_id} @ {x},{y}: {w}x{h}')
+    return '\n'.join(claims)
+
+
+@generator(4)
+def day04(scale, rng):
+    # the log is keyed by month and day, so there can't be more than a year of shifts
+    days = min(int(220 * scale), 365)
+    guards = [rng.randint(10, 3500) for _ in range(max(days // 10, 2))]
+
+    lines = []
+    for offset in range(days):
+        month, day = _date(offset + 1)
+        prev_month, prev_day = _date(offset)
+
+        if rng.random() < 0.5:
+            start = f'[1518-{prev_month:02}-{prev_day:02} 23:{rng.randint(45, 59):02}]'
+        else:
+            start = f'[1518-{month:02}-{day:02} 00:{rng.randint(0, 3):02}]'
+        lines.append(f'{start} Guard #{rng.choice(guards)} begins shift')
+
+        minute = rng.randint(5, 20)
+        while minute < 55:
+            wake = rng.randint(minute + 1, min(minute + 30, 59))
+            lines.append(f'[1518-{month:02}-{day:02} 00:{minute:02}] falls asleep')
+            lines.append(f'[1518-{month:02}-{day:02} 00:{wake:02}] wakes up')
+            minute = wake + rng.randint(1, 15)
+
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+def _date(day_of_year):
+    # 1518 was no leap year, day 0 is new year's eve of 1517 but that is never printed as such
+    lengths = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    if day_of_year == 0:
+        return 12, 31
+
+    month = 0
+    while day_of_year > lengths[month]:
+        day_of_year -= lengths[month]
+        month += 1
+    return month + 1, day_of_year
+
+
+@generator(5)
+def day05(scale, rng):
+    units = []
+    for _ in range(int(50000 * scale)):
+        char = rng.choice(string.ascii_lowercase[:rng.randint(4, 26)])
+        units.append(char.upper() if rng.random() < 0.5 else char)
+    return ''.join(units)
+
+
+@generator(6)
+def day06(scale, rng):
+    points = set()
+    while len(points) < int(50 * scale):
+        points.add((rng.randint(40, 360), rng.randint(40, 360)))
+
+    points = sorted(points)
+    rng.shuffle(points)
+    return '\n'.join(f'{x}, {y}' for x, y in points)
+
+
+@generator(7)
+def day07(scale, rng):
+    # steps are single letters, so we can only scale the number of dependencies between them
+    order = list(string.ascii_uppercase)
+    rng.shuffle(order)
+
+    pairs = [(a, b) for a in range(len(order)) for b in range(a + 1, len(order))]
+    chosen = rng.sample(pairs, min(int(100 * scale), len(pairs)))
+    return '\n'.join(
+        f'Step {order[a]} must be finished before step {order[b]} can begin.'
+        for a, b in chosen
+    )
+
+
+@generator(8)
+def day08(scale, rng):
+    budget = [int(1500 * scale)]
+    numbers = []
+
+    def node(depth):
+        budget[0] -= 1
+        children = rng.randint(1, 5) if depth < 10 and budget[0] > 0 else 0
+        metadata = rng.randint(1, 3)
+        numbers.extend((children, metadata))
+
+        for _ in range(children):
+            node(depth + 1)
+        numbers.extend(rng.randint(1, children + 2) for _ in range(metadata))
+
+    node(0)
+    return ' '.join(str(n) for n in numbers)
+
+
+@generator(9)
+def day09(scale, rng):
+    return f'{rng.randint(10, 500)} players; last marble is worth {int(70000 * scale)} points'
+
+
+EDGES = [(0, 0), (0, 9)]
+
+
+@generator(10)
+def day10(scale, rng):
+    # random "letters" that all points converge on after `seconds`, always exactly 10 lines high
+    seconds = rng.randint(8000, 12000)
+    width = int(8 * 8 * scale)
+    pixels = [(x, y) for x in range(width) for y in range(10) if rng.random() < 0.4 and (x, y) not in EDGES]
+
+    # top and bottom row move apart as fast as possible, so the image is only 10 lines high at `seconds`
+    velocities = [5, -5] + [rng.randint(-5, 5) for _ in pixels]
+
+    lines = []
+    for (x, y), vy in zip(EDGES + pixels, velocities):
+        vx = rng.randint(-5, 5)
+        start_x = x - vx * seconds
+        start_y = y - vy * seconds
+        lines.append(f'position=<{start_x: d}, {start_y: d}> velocity=<{vx: d}, {vy: d}>')
+
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+@generator(11)
+def day11(scale, rng):
+    # the grid size is part of the puzzle, so there's nothing to scale here
+    return str(rng.randint(1000, 9999))
+
+
+@generator(12)
+def day12(scale, rng):
+    # every pattern passes on its left neighbour, so the pots drift to the right one step per
+    # generation. that stabilizes immediately, which the solver relies on to finish part 2.
+    initial = ''.join(rng.choice('#.') for _ in range(int(100 * scale)))
+    rules = []
+    for value in range(32):
+        pattern = ''.join('#' if value & (1 << bit) else '.' for bit in range(5))
+        rules.append(f'{pattern} => {pattern[1]}')
+
+    rng.shuffle(rules)
+    return '\n'.join([f'initial state: {initial}', ''] + rules)
+
+
+@generator(13)
+def day13(scale, rng):
+    # one big loop with carts going both ways. there is one more cart going clockwise, so one is left
+    # in the end, and all of them start an even number of tiles apart, so they can't pass each other.
+    width = int(150 * _sqrt(scale))
+    height = int(150 * _sqrt(scale))
+    rows = [[' '] * width for _ in range(height)]
+
+    path = (
+        [(x, 0) for x in range(width)] +
+        [(width - 1, y) for y in range(1, height)] +
+        [(x, height - 1) for x in range(width - 2, -1, -1)] +
+        [(0, y) for y in range(height - 2, 0, -1)]
+    )
+    corners = {(0, 0): '/', (width - 1, 0): '\\', (width - 1, height - 1): '/', (0, height - 1): '\\'}
+
+    for x, y in path:
+        rows[y][x] = corners.get((x, y), '|' if x in (0, width - 1) else '-')
+
+    counter_clockwise = max(int(8 * scale), 1)  # part 1 needs at least one crash
+    spots = [(x, y) for index, (x, y) in enumerate(path) if index % 2 == 0 and (x, y) not in corners]
+    spots = rng.sample(spots, 2 * counter_clockwise + 1)
+
+    for index, (x, y) in enumerate(spots):
+        if y == 0:
+            cart = '><'
+        elif x == width - 1:
+            cart = 'v^'
+        elif y == height - 1:
+            cart = '<>'
+        else:
+            cart = '^v'
+        rows[y][x] = cart[index % 2]
+
+    return '\n'.join(''.join(row) for row in rows)
+
+
+@generator(14)
+def day14(scale, rng):
+    # pick the digits from the scoreboard itself, so part 2 is guaranteed to find them
+    position = int(rng.randint(200000, 400000) * scale)
+    scores = bytearray([3, 7])
+    first, second = 0, 1
+
+    while len(scores) < position + 6:
+        total = scores[first] + scores[second]
+        if total >= 10:
+            scores.append(1)
+        scores.append(total % 10)
+        first = (first + 1 + scores[first]) % len(scores)
+        second = (second + 1 + scores[second]) % len(scores)
+
+    return ''.join(str(score) for score in scores[position:position + 6])
+
+
+def _connected(open_cells, rng):
+    # the largest region reachable from a random cell, so every unit can reach every other one eventually
+    best = set()
+    remaining = set(open_cells)
+
+    while remaining:
+        start = rng.choice(sorted(remaining))
+        region = {start}
+        queue = deque([start])
+        while queue:
+            x, y = queue.popleft()
+            for other in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if other in remaining and other not in region:
+                    region.add(other)
+                    queue.append(other)
+
+        remaining -= region
+        if len(region) > len(best):
+            best = region
+
+    return best
+
+
+@generator(15)
+def day15(scale, rng):
+    size = int(32 * _sqrt(scale))
+    candidates = [(x, y) for y in range(1, size - 1) for x in range(1, size - 1) if rng.random() > 0.3]
+    cave = _connected(candidates, rng)
+
+    units = rng.sample(sorted(cave), min(int(30 * scale), len(cave)))
+    elves = set(units[:max(len(units) // 3, 1)])
+    goblins = set(units[len(elves):])
+
+    rows = []
+    for y in range(size):
+        row = ''
+        for x in range(size):
+            if (x, y) in elves:
+                row += 'E'
+            elif (x, y) in goblins:
+                row += 'G'
+            elif (x, y) in cave:
+                row += '.'
+            else:
+                row += '#'
+        rows.append(row)
+    return '\n'.join(rows)
+
+
+def _sample(rng, opcodes, opcode):
+    operation = Operation(f'{opcode} {rng.randint(0, 3)} {rng.randint(0, 3)} {rng.randint(0, 3)}')
+    before = [rng.randint(0, 15) for _ in range(4)]
+    after = opcodes[opcode](operation).run_operation(before)
+    matching = {cls for cls in ALL_INSTRUCTIONS if cls(operation).run_operation(before) == after}
+    return operation, before, after, matching
+
+
+@generator(16)
+def day16(scale, rng):
+    opcodes = list(ALL_INSTRUCTIONS)
+    rng.shuffle(opcodes)
+
+    # the solver peels off opcodes whose samples only ever matched one instruction that is still left,
+    # so every sample may only match its own instruction and the ones of opcodes resolved before it
+    order = list(range(len(opcodes)))
+    rng.shuffle(order)
+    allowed = {}
+    for index, opcode in enumerate(order):
+        allowed[opcode] = {opcodes[code] for code in order[:index + 1]}
+
+    samples = []
+    count = max(int(800 * scale), len(opcodes))
+    while len(samples) < count:
+        # the first round makes sure every opcode shows up at least once
+        opcode = order[len(samples)] if len(samples) < len(order) else rng.randrange(len(opcodes))
+        operation, before, after, matching = _sample(rng, opcodes, opcode)
+        if not matching <= allowed[opcode]:
+            continue
+
+        samples.append(
+            f'Before: [{", ".join(str(r) for r in before)}]\n'
+            f'{operation.opcode} {operation.in_a} {operation.in_b} {operation.out}\n'
+            f'After:  [{", ".join(str(r) for r in after)}]'
+        )
+
+    program = [
+        f'{rng.randrange(len(opcodes))} {rng.randint(0, 3)} {rng.randint(0, 3)} {rng.randint(0, 3)}'
+        for _ in range(int(900 * scale))
+    ]
+    return '\n\n'.join(samples) + '\n\n\n\n' + '\n'.join(program)
+
+
+@generator(17)
+def day17(scale, rng):
+    spread = int(150 * _sqrt(scale))
+    depth = int(1800 * _sqrt(scale))
+
+    veins = []
+    for _ in range(int(600 * scale)):
+        left = rng.randint(500 - spread, 500 + spread)
+        right = left + rng.randint(3, 25)
+        bottom = rng.randint(20, depth)
+
+        veins.append(f'x={left}, y={bottom - rng.randint(2, 15)}..{bottom}')
+        veins.append(f'x={right}, y={bottom - rng.randint(2, 15)}..{bottom}')
+        veins.append(f'y={bottom}, x={left}..{right}')
+
+    return '\n'.join(veins)
+
+
+@generator(18)
+def day18(scale, rng):
+    size = int(50 * _sqrt(scale))
+    return '\n'.join(''.join(rng.choice('..|#') for _ in range(size)) for _ in range(size))
+
+
+def _patch(lines, index, value):
+    # replaces the immediate B value of an instruction line, everything else stays as it is
+    name, a, b, c = lines[index].split(' ')
+    lines[index] = f'{name} {a} {value} {c}'
+
+
+@generator(19)
+def day19(scale, rng):
+    # the solver replaces parts of the program with optimized instructions at fixed positions,
+    # so we keep the real program and only change the constants that make up the number it works on
+    with open('inputs/day19.txt') as f:
+        lines = f.read().split('\n')
+
+    _patch(lines, 22, int(rng.randint(2, 9) * scale))
+    _patch(lines, 24, int(rng.randint(10, 99) * scale))
+    return '\n'.join(lines)
+
+
+@generator(20)
+def day20(scale, rng):
+    # branches only ever come at the end of a route, which is how the solver expects them
+    budget = [int(400 * scale)]
+
+    def route(depth):
+        steps = ''.join(rng.choice('NESW') for _ in range(rng.randint(1, 8)))
+
+        if budget[0] > 0 and depth < 12 and rng.random() < (0.95 if depth < 3 else 0.6):
+            budget[0] -= 1
+            options = [route(depth + 1) for _ in range(rng.randint(2, 3))]
+            if rng.random() < 0.2:
+                options.append('')  # detour, the route just goes on without it
+            steps += '(' + '|'.join(options) + ')'
+
+        return steps
+
+    return '^' + route(0) + '$'
+
+
+@generator(21)
+def day21(scale, rng):
+    # the hash loop is hardcoded into the solver, only its seed can change. the number of values
+    # until the hash repeats doesn't depend on the input size, so there is nothing to scale.
+    with open('inputs/day21.txt') as f:
+        lines = f.read().split('\n')
+
+    name, _, b, c = lines[8].split(' ')
+    lines[8] = f'{name} {rng.randint(1, 16777215)} {b} {c}'
+    return '\n'.join(lines)
+
+
+@generator(22)
+def day22(scale, rng):
+    factor = _sqrt(scale)
+    return (
+        f'depth: {rng.randint(3000, 12000)}\n'
+        f'target: {int(rng.randint(5, 15) * factor)},{int(rng.randint(600, 800) * factor)}'
+    )
+
+
+@generator(23)
+def day23(scale, rng):
+    # like the real inputs most bots just about reach one spot in the middle of the cluster, spread out at
+    # random there are so many equally good spots that part 2 takes forever to narrow them down
+    target = [rng.randint(-1_000_000, 1_000_000) for _ in range(3)]
+
+    lines = []
+    for _ in range(int(1000 * scale)):
+        position = [int(rng.gauss(center, 30_000_000)) for center in target]
+        distance = sum(abs(a - b) for a, b in zip(position, target))
+        radius = distance if rng.random() < 0.98 else rng.randint(50_000_000, 100_000_000)
+        lines.append(f'pos=<{",".join(str(v) for v in position)}>, r={radius}')
+    return '\n'.join(lines)
+
+
+DAMAGE_TYPES = ['bludgeoning', 'cold', 'fire', 'radiation', 'slashing']
+
+
+def _battle_group(rng, initiative, strength):
+    units = rng.randint(100, 9000)
+    hit_points = rng.randint(1000, 50000)
+
+    types = rng.sample(DAMAGE_TYPES, 3)
+    modifiers = []
+    if rng.random() < 0.3:
+        modifiers.append(f'immune to {types[0]}')
+    if rng.random() < 0.6:
+        modifiers.append(f'weak to {", ".join(types[1:rng.randint(2, 3)])}')
+    rng.shuffle(modifiers)
+    modifiers = f' ({"; ".join(modifiers)})' if modifiers else ''
+
+    # enough to take out a couple of percent of a similar group per round
+    damage = max(int(hit_points * strength * rng.uniform(0.005, 0.02)), 1)
+    return (
+        f'{units} units each with {hit_points} hit points{modifiers} '
+        f'with an attack that does {damage} {rng.choice(DAMAGE_TYPES)} damage at initiative {initiative}'
+    )
+
+
+@generator(24)
+def day24(scale, rng):
+    groups = int(10 * scale)
+    initiatives = list(range(1, 2 * groups + 1))
+    rng.shuffle(initiatives)
+
+    immune = [_battle_group(rng, initiatives.pop(), 0.8) for _ in range(groups)]
+    infection = [_battle_group(rng, initiatives.pop(), 1.0) for _ in range(groups)]
+    return '\n'.join(['Immune System:'] + immune + ['', 'Infection:'] + infection)
+
+
+@generator(25)
+def day25(scale, rng):
+    return '\n'.join(
+        ','.join(str(rng.randint(-8, 8)) for _ in range(4))
+        for _ in range(int(1000 * scale))
+    )
@@ -1,6 +1,7 @@
 import copy
 from collections import defaultdict
 
+from utils import counters, render
 from utils.point import Point, UniquePoint
 
 
@@ -23,12 +24,11 @@ class Grid:
         new_grid.max_y = self.max_y
         return new_grid
 
+    def draw(self):
+        return '\n'.join(''.join(self[(x, y)] for x in self.iter_x()) for y in self.iter_y())
+
     def print(self):
-        for y in self.iter_y():
-            line = ''
-            for x in self.iter_x():
-                line += self[(x, y)]
-            print(line)
+        render.defer(self.draw)
 
     def set(self, x, y, item):
         self.grid[y][x] = item
@@ -80,4 +80,7 @@ class Grid:
         else:
             x, y = key
 
-        self.set(x, y, value)
\ No newline at end of file
+        self.set(x, y, value)
+
+
+counters.count_calls(Grid, 'get', 'grid.cells_touched')
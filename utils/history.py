@@ -0,0 +1,97 @@
+"""
+keeps the timing and memory of every part that actually ran in a sqlite database, to spot regressions
+and to know which days take longest before running them.
+max_rss is the peak rss of the part alone, where the system can tell (linux), and missing elsewhere.
+"""
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+
+from day import OK
+from utils.cache import CACHE_DIR
+
+HISTORY_FILE = os.path.join(CACHE_DIR, 'history.sqlite')
+
+# timings this close to the median are noise, however many percent that is
+MIN_SECONDS = 0.01
+
+
+def revision():
+    try:
+        described = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return described.stdout.strip()
+
+
+class History:
+    def __init__(self, path=HISTORY_FILE, record=True):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.record = record
+        self.revision = revision() if record else None
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS timings ('
+                'recorded REAL, revision TEXT, day TEXT, part INTEGER, status TEXT, elapsed REAL, max_rss INTEGER)'
+            )
+            self.connection.execute('CREATE INDEX IF NOT EXISTS timings_part ON timings (day, part, recorded)')
+
+    def add(self, result):
+        if not self.record or result.cached:
+            return  # nothing was measured
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (time.time(), self.revision, result.day, result.part, result.status, result.elapsed, result.max_rss),
+            )
+
+    def timings(self, day, part, limit=None):
+        # the most recent first, only of runs that finished
+        rows = self.connection.execute(
+            'SELECT elapsed FROM timings WHERE day = ? AND part = ? AND status = ? ORDER BY recorded DESC LIMIT ?',
+            (day, part, OK, -1 if limit is None else limit),
+        )
+        return [elapsed for elapsed, in rows]
+
+    def expected(self, day, parts, window=5):
+        """how long the parts of a day probably take together, None if one of them never ran"""
+        total = 0
+        for part in parts:
+            timings = self.timings(day, part, window)
+            if not timings:
+                return None
+            total += statistics.median(timings)
+        return total
+
+    def regressions(self, threshold=0.2, window=5):
+        """
+        compares the latest timing of every part to the median of the `window` runs before it.
+        yields (day, part, latest, median, regressed), regressed if it is more than `threshold` slower.
+        """
+        parts = self.connection.execute('SELECT DISTINCT day, part FROM timings ORDER BY day, part').fetchall()
+        for day, part in parts:
+            timings = self.timings(day, part, window + 1)
+            if len(timings) < 2:
+                continue
+
+            latest, median = timings[0], statistics.median(timings[1:])
+            regressed = latest > median * (1 + threshold) and latest - median > MIN_SECONDS
+            yield day, part, latest, median, regressed
+
+
+def report(threshold=0.2, window=5):
+    regressed = 0
+    for day, part, latest, median, flagged in History(record=False).regressions(threshold, window):
+        change = (latest - median) / median * 100 if median else 0
+        marker = '  REGRESSION' if flagged else ''
+        print(f'{day} part {part}: {latest:.3f}s, median {median:.3f}s ({change:+.1f}%){marker}')
+        regressed += flagged
+
+    print(f'{regressed} parts slower than {threshold:.0%} over the median of their last {window} runs')
+    return regressed
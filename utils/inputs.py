@@ -0,0 +1,55 @@
+import mmap
+
+TEXT = 'text'
+LINES = 'lines'
+MMAP = 'mmap'
+BUFFER = 'buffer'
+
+
+class Lines:
+    """
+    lazily reads the lines of a file, split the same way as str.split('\\n') would do it.
+    can be iterated more than once, every iteration streams the file again.
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def __iter__(self):
+        with open(self.file_name, 'r') as f:
+            line = ''
+            for line in f:
+                yield line[:-1] if line.endswith('\n') else line
+
+            if not line or line.endswith('\n'):
+                yield ''
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.file_name!r})'
+
+
+def _map(file_name):
+    with open(file_name, 'rb') as f:
+        try:
+            # the mapping stays valid after the file is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            return b''
+
+
+def open_input(file_name, mode=TEXT):
+    if mode == TEXT:
+        with open(file_name, 'r') as f:
+            return f.read()
+
+    if mode == LINES:
+        return Lines(file_name)
+
+    if mode == MMAP:
+        return _map(file_name)
+
+    if mode == BUFFER:
+        return memoryview(_map(file_name))
+
+    raise ValueError(f'Unknown input mode "{mode}"')
@@ -0,0 +1,107 @@
+import functools
+import hashlib
+import sys
+from collections import OrderedDict
+
+from utils import counters
+from utils.cache import DiskCache, MISSING
+
+_memos = []  # (name, stats, entries) of every memoized function
+_reported = {}  # what counters last got to see, it only wants what happened since
+_use_disk = False  # opt-in, see use_disk()
+
+
+class MemoCache(DiskCache):
+    name = 'memo'
+    default_size = 64 * 1024 * 1024
+
+
+def _code_hash(func):
+    # the whole module, the function itself is rarely the only code its result depends on
+    try:
+        with open(sys.modules[func.__module__].__file__, 'rb') as f:
+            code = f.read()
+    except (AttributeError, KeyError, OSError):
+        code = func.__code__.co_code
+    return hashlib.sha256(code).hexdigest()
+
+
+def memo(maxsize=1024, persist=False, key=None):
+    """
+    memoizes a pure function in a bounded LRU. `key` turns the call arguments into what the result actually
+    depends on and defaults to all of them. methods should pass one, so the cache holds the few attributes
+    that matter instead of pinning `self` (which is what lru_cache on a method does).
+    with `persist` results are also written to disk once use_disk() was called, keyed by the key's repr and a
+    hash of the function's module, so they survive between runs and are shared between worker processes.
+    """
+    def decorate(func):
+        entries = OrderedDict()
+        get = entries.get
+        move_to_end = entries.move_to_end
+        stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        disk = MemoCache() if persist else None
+        name = func.__qualname__
+        code_hash = []  # only needed once something goes to disk
+
+        def disk_key(cache_key):
+            if not code_hash:
+                code_hash.append(_code_hash(func))
+            return hashlib.sha256(f'{name}:{code_hash[0]}:{cache_key!r}'.encode()).hexdigest()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+
+            value = get(cache_key, MISSING)
+            if value is not MISSING:
+                move_to_end(cache_key)
+                stats['hits'] += 1
+                return value
+
+            persisted = disk and _use_disk
+            value = disk.load(disk_key(cache_key)) if persisted else MISSING
+            if value is MISSING:
+                stats['misses'] += 1
+                value = func(*args, **kwargs)
+                if persisted:
+                    disk.store(disk_key(cache_key), value)
+            else:
+                stats['disk_hits'] += 1
+
+            entries[cache_key] = value
+            if len(entries) > maxsize:
+                entries.popitem(last=False)
+            return value
+
+        wrapper.stats = lambda: dict(stats, size=len(entries), maxsize=maxsize)
+        wrapper.cache_clear = entries.clear
+        _memos.append((name, stats, entries))
+        return wrapper
+
+    return decorate
+
+
+def use_disk(enabled=True):
+    # off by default: timings taken while persisted memos load their results measure the disk, not the work
+    global _use_disk
+    _use_disk = enabled
+
+
+def clear_all():
+    # for runs that must not find results of the ones before in memory, like bench.py's samples
+    for _, _, entries in _memos:
+        entries.clear()
+
+
+def _collect():
+    # hits and misses are plain ints in the hot path, --counters gets the difference since it last asked
+    counts = {}
+    for name, stats, _ in _memos:
+        for stat, value in stats.items():
+            counter = f'memo.{name}.{stat}'
+            counts[counter] = value - _reported.get(counter, 0)
+            _reported[counter] = value
+    return counts
+
+
+counters.add_source(_collect)
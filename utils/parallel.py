@@ -0,0 +1,51 @@
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from day import PARTS
+from utils import timer
+from utils.cache import ResultCache
+from utils.supervisor import supervise
+
+
+def _solve(module, name, parts, use_cache, parsed_cache, timeout, options):
+    # runs inside a worker process, so the day is imported and parsed there
+    timer.collect()
+    day = getattr(importlib.import_module(module), name)(parsed_cache)
+    cache = ResultCache() if use_cache else None
+
+    if timeout:
+        return list(supervise(day, parts, timeout, cache=cache, **options))
+    return list(day.solve_parts(parts, cache, capture=True, **options))
+
+
+def run_parallel(days, workers=None, use_cache=True, parsed_cache=None, timeout=None, parts=PARTS, history=None,
+                 **options):
+    workers = workers or os.cpu_count()
+    jobs = [(day, tuple(group)) for day in days for group in day.groups(parts)]
+    if history:
+        # longest first, so no long day starts last while the other workers run out of work.
+        # days that never ran could be anything, they go first too
+        def expected(job):
+            seconds = history.expected(job[0].__name__, job[1])
+            return float('inf') if seconds is None else seconds
+        jobs.sort(key=expected, reverse=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for day, group in jobs:
+            futures[day, group] = executor.submit(
+                _solve, day.__module__, day.__name__, list(group), use_cache, parsed_cache, timeout, options,
+            )
+
+        # everything is queued already, we just print the results in order as soon as they are available
+        for day in days:
+            print(f'=== {day.__name__} ===')
+            for group in sorted(group for job_day, group in jobs if job_day is day):
+                for result in futures[day, group].result():
+                    result.report()
+                    if result.trace:
+                        timer.add_events(result.trace)
+                    if history:
+                        history.add(result)
+            print()
@@ -58,7 +58,13 @@ class Point:
 class UniquePoint(Point):
     def __init__(self, x, y, name=None):
         super().__init__(x, y)
-        self.hash = hash((self.x, self.y, name))
+        self._key = (self.x, self.y, name)
+        self.hash = hash(self._key)
+
+    def __setstate__(self, state):
+        # hash(None) is not the same in every interpreter, so unpickled points need a fresh hash
+        self.__dict__.update(state)
+        self.hash = hash(self._key)
 
     def __eq__(self, other):
         return self.hash == other.hash
@@ -0,0 +1,85 @@
+import cProfile
+import io
+import os
+import pstats
+from collections import defaultdict
+
+PROFILE_DIR = 'profiles'
+
+# stacks that account for less than this many seconds aren't worth walking into
+MIN_TIME = 1e-6
+MAX_DEPTH = 128
+
+
+def _label(func):
+    file_name, line, name = func
+    if file_name == '~':
+        # builtins
+        return name
+    return f'{os.path.basename(file_name)}:{line}({name})'
+
+
+def collapse(stats):
+    """
+    turns the caller/callee graph of cProfile into collapsed stacks ("a;b;c <microseconds>") for flamegraph tools.
+    cProfile doesn't record full stacks, so a callee's time is split between its callers by their share of its
+    cumulative time - which is exact for everything that is only called from one place.
+    """
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, timing in callers.items():
+            callees[caller][func] = timing
+
+    stacks = defaultdict(float)
+
+    def walk(func, stack, scale):
+        _, _, own_time, total_time, _ = stats[func]
+        stack = stack + [func]
+        stacks[';'.join(_label(f) for f in stack)] += own_time * scale
+
+        if len(stack) >= MAX_DEPTH:
+            return
+
+        for callee, (_, _, _, callee_time) in callees[func].items():
+            if callee in stack:
+                # recursion, the time is already part of the callers
+                continue
+
+            callee_total = stats[callee][3]
+            callee_scale = scale * callee_time / callee_total if callee_total else 0
+            if callee_total * callee_scale >= MIN_TIME:
+                walk(callee, stack, callee_scale)
+
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(func, [], 1.0)
+
+    return [f'{stack} {round(seconds * 1_000_000)}' for stack, seconds in stacks.items() if seconds >= MIN_TIME]
+
+
+class Profile:
+    def __init__(self, name, top=15):
+        self.name = name
+        self.top = top
+        self.summary = ''
+        self._profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, *_):
+        self._profiler.disable()
+        stats = pstats.Stats(self._profiler)
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base_name = os.path.join(PROFILE_DIR, self.name)
+        stats.dump_stats(f'{base_name}.pstats')
+        with open(f'{base_name}.collapsed', 'w') as f:
+            f.write('\n'.join(collapse(stats.stats)) + '\n')
+
+        summary = io.StringIO()
+        stats.stream = summary
+        for sort in ('cumulative', 'tottime'):
+            stats.sort_stats(sort).print_stats(self.top)
+        self.summary = f'profile written to {base_name}.pstats / .collapsed\n{summary.getvalue()}'
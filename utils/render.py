@@ -0,0 +1,91 @@
+"""
+where visual output (grids, frames, progress) goes. parts hand it over with write() or defer() instead of
+printing, and it only gets built and written once the part's timing is done, in one go. with a discarding
+sink (--quiet, bench) deferred renders are never even built.
+"""
+import io
+import sys
+from functools import partial
+
+from utils.timer import span
+
+
+class StdoutSink:
+    discard = False
+
+    def write(self, text):
+        # looked up on every write, so redirected stdout (captured parts) gets it as well
+        sys.stdout.write(text)
+
+
+class FileSink:
+    discard = False
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def write(self, text):
+        with open(self.file_name, 'a') as f:
+            f.write(text)
+
+
+class MemorySink:
+    discard = False
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+
+    def write(self, text):
+        self.buffer.write(text)
+
+    def getvalue(self):
+        return self.buffer.getvalue()
+
+
+class NullSink:
+    discard = True
+
+    def write(self, text):
+        pass
+
+
+_sink = StdoutSink()
+_pending = []
+
+
+def use(sink):
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def write(text):
+    # for things that have to be shown as they are right now, e.g. progress messages
+    if not _sink.discard:
+        _pending.append(text)
+
+
+def defer(func, *args, **kwargs):
+    # func returns the text to show. it gets called when the part is done, so it sees the final state
+    if not _sink.discard:
+        _pending.append(partial(func, *args, **kwargs))
+
+
+def discard():
+    _pending.clear()
+
+
+def flush():
+    if not _pending:
+        return
+
+    with span('render'):
+        buffer = io.StringIO()
+        for item in _pending:
+            text = item() if callable(item) else item
+            buffer.write(text)
+            if not text.endswith('\n'):
+                buffer.write('\n')
+
+        _pending.clear()
+        _sink.write(buffer.getvalue())
@@ -0,0 +1,77 @@
+def first(predicate, start=0, probes=1, executor=None, verify=1):
+    """
+    finds the smallest value >= start for which `predicate` returns something other than None and returns
+    (value, result). the predicate should be monotone: None up to some point and a result from then on.
+
+    gallops ahead (start, start + 1, start + 3, start + 7, ...) until a result shows up and then bisects
+    what is left, so it takes O(log answer) calls instead of O(answer). with `probes` > 1 that many values are
+    tried at once on `executor`, which then needs a predicate that can be pickled.
+
+    real predicates tend to be only mostly monotone, so the `verify` values right below the answer are
+    checked as well, and the search moves down as long as one of them has a result too.
+    """
+    results = {}
+
+    def probe(values):
+        values = [value for value in values if value not in results]
+        if executor and len(values) > 1:
+            outcomes = executor.map(predicate, values)
+        else:
+            outcomes = map(predicate, values)
+        results.update(zip(values, outcomes))
+
+    # everything up to `low` has no result, `high` has one
+    low = start - 1
+    high = None
+    offset = 0
+    while high is None:
+        candidates = []
+        for _ in range(probes):
+            candidates.append(start + offset)
+            offset = offset * 2 + 1
+
+        probe(candidates)
+        for value in candidates:
+            if results[value] is not None:
+                high = value
+                break
+            low = value
+
+    while high - low > 1:
+        count = min(probes, high - low - 1)
+        candidates = sorted({low + (high - low) * (index + 1) // (count + 1) for index in range(count)})
+
+        probe(candidates)
+        for value in candidates:
+            if results[value] is not None:
+                high = value
+                break
+            low = value
+
+    while True:
+        below = list(range(max(high - verify, start), high))
+        probe(below)
+
+        lower = [value for value in below if results[value] is not None]
+        if not lower:
+            return high, results[high]
+        high = lower[0]
+
+
+def scan(predicate, start=0, probes=1, executor=None):
+    """
+    the same as first(), for predicates that are not monotone at all: tries start, start + 1, ...
+    in order, `probes` of them at once on `executor`.
+    """
+    value = start
+    while True:
+        candidates = list(range(value, value + probes))
+        if executor and probes > 1:
+            outcomes = executor.map(predicate, candidates)
+        else:
+            outcomes = map(predicate, candidates)
+
+        for candidate, result in zip(candidates, outcomes):
+            if result is not None:
+                return candidate, result
+        value += probes
@@ -0,0 +1,56 @@
+"""
+puts an input into shared memory once, so process pool workers can attach to it instead of getting
+a pickled copy with every task. works for anything with the buffer protocol (bytes, array.array of ints)
+and for str, which is stored utf-8 encoded.
+
+    with Shared(self.input) as shared:
+        executor.map(worker, items, repeat(shared.handle))
+
+    def worker(item, handle):
+        data = attach(handle)  # a memoryview, already cast to the format of the original
+"""
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+Handle = namedtuple('Handle', 'name size format')
+
+# segments this process attached to, they have to stay open as long as their views are in use
+_attached = {}
+
+
+class Shared:
+    def __init__(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+
+        view = memoryview(data)
+        self._memory = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+        self._memory.buf[:view.nbytes] = view.cast('B')
+        self.handle = Handle(self._memory.name, view.nbytes, view.format)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self._memory:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+
+def attach(handle):
+    if handle.name not in _attached:
+        # workers started by multiprocessing share the resource tracker of their parent, so attaching
+        # registers the segment a second time, which is a no-op. the owner unlinks it in the end.
+        _attached[handle.name] = shared_memory.SharedMemory(name=handle.name)
+
+    return _attached[handle.name].buf[:handle.size].cast(handle.format)
+
+
+def detach(handle):
+    memory = _attached.pop(handle.name, None)
+    if memory:
+        memory.close()
@@ -0,0 +1,150 @@
+import functools
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from day import PartResult, ERROR, SKIPPED, TIMEOUT
+from utils import render, timer
+from utils.cache import source_hash
+
+
+def _worker(connection, day, parts, options):
+    timer.collect()  # spans the parent recorded before forking are not ours to send
+
+    if hasattr(os, 'setpgrp'):
+        # parts may start process pools of their own, in a group of ours they can be stopped along with us
+        os.setpgrp()
+    signal.signal(signal.SIGTERM, functools.partial(_terminated, os.getpid()))
+
+    try:
+        for result in day.solve_parts(parts, capture=True, **options):
+            connection.send(result)
+    except Exception:
+        connection.send(traceback.format_exc())
+    finally:
+        connection.close()
+
+
+def _terminated(worker_pid, *_):
+    if os.getpid() != worker_pid:
+        # a pool worker forked by the part, which inherited this handler. dying makes the pool give up on
+        # its queued tasks instead of waiting for them
+        os._exit(1)
+    # unwinds the part, so its pools shut down and its shared memory gets unlinked
+    sys.exit(1)
+
+
+def _signal_group(process, signum):
+    try:
+        os.killpg(process.pid, signum)
+    except ProcessLookupError:
+        pass  # nothing left of it
+
+
+def _stop(process, grace=5):
+    if not hasattr(os, 'killpg'):
+        # no process groups on windows, only the child itself can go
+        process.kill()
+        process.join()
+        return
+
+    # asks nicely first, then kills whatever is left of the child's group: pool workers outlive a killed child
+    if process.is_alive():
+        _signal_group(process, signal.SIGTERM)
+        process.join(grace)
+    _signal_group(process, signal.SIGKILL)
+    process.kill()  # in case it never got to start its group
+    process.join()
+
+
+def supervise(day, parts, timeout, **options):
+    """
+    runs the parts in a child process and kills it if a single part takes longer than `timeout` seconds.
+    yields a PartResult for every part, including the ones that timed out, failed or had to be skipped.
+    `day` gets copied into every child that is started, along with whatever it has loaded so far.
+    """
+    name = day.__class__.__name__
+    remaining = list(parts)
+
+    while remaining:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_worker,
+            args=(sender, day, remaining, options),
+        )
+        process.start()
+        sender.close()
+        failed = None
+
+        try:
+            while remaining:
+                start = time.perf_counter()
+                if not receiver.poll(timeout):
+                    failed = remaining.pop(0)
+                    yield PartResult(name, failed, elapsed=time.perf_counter() - start, status=TIMEOUT)
+                    break
+
+                try:
+                    message = receiver.recv()
+                except EOFError:
+                    message = 'worker died unexpectedly'
+
+                if isinstance(message, str):
+                    failed = remaining.pop(0)
+                    yield PartResult(name, failed, message, time.perf_counter() - start, status=ERROR)
+                    break
+
+                remaining.remove(message.part)
+                yield message
+        finally:
+            _stop(process)
+            receiver.close()
+
+        # parts building on the one that just failed can't run, the others get a new child
+        for part in [part for part in remaining if failed in day.dependencies(part)]:
+            remaining.remove(part)
+            yield PartResult(name, part, status=SKIPPED)
+
+
+def available_cpus():
+    # the ones this process may run on, which can be fewer than the machine has
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def supervise_groups(day, groups, timeout=None, cache=None, **options):
+    """
+    runs the groups of parts in child processes, as many at the same time as there are CPUs, and yields the
+    results in order. the input is parsed first, so the children get a copy instead of parsing it again.
+    with a single CPU they take turns in this process, side by side they only look slower.
+    """
+    key = source_hash(day) if cache else None
+    todo = [group for group in groups if not cache or not all(cache.get(key, part) for part in group)]
+    workers = min(len(todo), available_cpus())
+    results = []
+
+    if workers > 1:
+        day.input
+        # whatever parsing wanted to show, before every child inherits a copy to show as well
+        render.flush()
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(list, supervise(day, group, timeout, cache=cache, **options)) for group in todo]
+            for future in futures:
+                results.extend(future.result())
+    else:
+        for group in todo:
+            if timeout:
+                results.extend(supervise(day, group, timeout, cache=cache, **options))
+            else:
+                results.extend(day.solve_parts(group, cache, **options))
+
+    for group in groups:
+        if group not in todo:
+            results.extend(day.solve_parts(group, cache, **options))
+
+    yield from sorted(results, key=lambda result: result.part)
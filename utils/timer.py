@@ -1,10 +1,110 @@
-from time import time
+import functools
+import json
+import os
+import threading
+from time import perf_counter, perf_counter_ns
+
+# finished spans as chrome trace events, only collected while tracing is enabled
+_events = []
+_lock = threading.Lock()
+_enabled = False
+
+
+def enable_tracing(enabled=True):
+    global _enabled
+    _enabled = enabled
+
+
+def tracing():
+    return _enabled
+
+
+def _record(name, start, end, args):
+    event = {
+        'name': name,
+        'ph': 'X',
+        # the trace format wants microseconds
+        'ts': start / 1000,
+        'dur': (end - start) / 1000,
+        'pid': os.getpid(),
+        'tid': threading.get_ident(),
+    }
+    if args:
+        event['args'] = args
+
+    with _lock:
+        _events.append(event)
+
+
+class span:
+    """
+    times a block, or a function when used as decorator, while tracing is enabled.
+    nested spans show up nested in the trace viewer, as long as they run on the same thread.
+    """
+
+    def __init__(self, name=None, **args):
+        self.name = name
+        self.args = args
+        self._starts = threading.local()
+
+    def __enter__(self):
+        if _enabled:
+            # a stack per thread, so the same span object can be entered recursively and concurrently
+            starts = getattr(self._starts, 'stack', None)
+            if starts is None:
+                starts = self._starts.stack = []
+            starts.append(perf_counter_ns())
+        return self
+
+    def __exit__(self, *_):
+        stack = getattr(self._starts, 'stack', None)
+        if stack:
+            _record(self.name, stack.pop(), perf_counter_ns(), self.args)
+
+    def __call__(self, func):
+        if self.name is None:
+            self.name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def collect():
+    # hands over everything recorded in this process so far, e.g. to send it to the parent process
+    with _lock:
+        events = _events[:]
+        _events.clear()
+    return events
+
+
+def add_events(events):
+    # events collected in another process
+    with _lock:
+        _events.extend(events)
+
+
+def export(file_name):
+    events = collect()
+    main = os.getpid()
+    metadata = [
+        {'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'main' if pid == main else f'worker {pid}'}}
+        for pid in sorted({event['pid'] for event in events})
+    ]
+
+    with open(file_name, 'w') as f:
+        json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+    return len(events)
 
 
 class Timer:
 
-    def __init__(self):
-        self.start = time()
+    def __init__(self, silent=False):
+        self.start = perf_counter()
+        self.silent = silent
+        self.total = None
 
     def next(self, *message, reset=None):
         if isinstance(message[-1], bool) and reset is None:
@@ -12,16 +112,26 @@ class Timer:
             message = message[:-1]
 
         msg = ' '.join([f'{x}' for x in message])
-        print(f'{msg}: {self.elapsed(reset)}s')
+        start = self.start
+        elapsed = self.elapsed(reset)
+        if _enabled:
+            # the phase since the last reset is a span as well
+            _record(msg, int(start * 1e9), int((start + elapsed) * 1e9), None)
+
+        from utils import render  # it uses spans itself
+        render.write(f'{msg}: {elapsed}s')
 
     def elapsed(self, reset=False):
-        result = time() - self.start
+        result = perf_counter() - self.start
         if reset:
-            self.start = time()
+            self.start = perf_counter()
         return result
 
     def __enter__(self):
-        self.start = time()
+        self.start = perf_counter()
+        return self
 
     def __exit__(self, *_):
-        print(f'Completed in {self.elapsed()}s')
+        self.total = self.elapsed()
+        if not self.silent:
+            print(f'Completed in {self.total}s')
@@ -0,0 +1,144 @@
+"""
+re-runs a day whenever its module or anything in utils/ is saved. changed modules are reloaded in place,
+and so is every module of ours that imported something from them by name, or it would keep the old one.
+the parsed input is kept as long as parse() stays the same and the input file does not change.
+"""
+import importlib
+import inspect
+import os
+import sys
+import time
+import traceback
+
+from day import PARTS
+from utils import memo
+from utils.daemon import ParsedInputs
+
+UTILS_DIR = os.path.dirname(__file__)
+
+
+def _watched(day_module):
+    files = {day_module.__file__: day_module.__name__}
+    for file_name in os.listdir(UTILS_DIR):
+        if file_name.endswith('.py'):
+            files[os.path.join(UTILS_DIR, file_name)] = f'utils.{file_name[:-3]}'
+    return files
+
+
+def _mtimes(files):
+    mtimes = {}
+    for file_name in files:
+        try:
+            mtimes[file_name] = os.stat(file_name).st_mtime_ns
+        except FileNotFoundError:
+            pass  # editors like to save by moving a new file in place
+    return mtimes
+
+
+def _parse_key(day):
+    # what the parsed input depends on, as far as we can tell without running it
+    try:
+        code = inspect.getsource(day.parse)
+    except (OSError, TypeError):
+        code = day.parse.__code__.co_code
+    return code, day.input_mode, os.stat(day.input_file).st_mtime_ns
+
+
+def _uses(module, names):
+    for value in vars(module).values():
+        if inspect.ismodule(value):
+            if value.__name__ in names:
+                return True
+        elif getattr(value, '__module__', None) in names:
+            return True
+    return False
+
+
+def _dependents(names):
+    root = os.path.dirname(UTILS_DIR)
+    names = set(names)
+    found = True
+    while found:
+        found = False
+        for name, module in list(sys.modules.items()):
+            # packages only know their submodules, and scripts run as __main__ can't be reloaded
+            spec = getattr(module, '__spec__', None)
+            if name in names or spec is None or spec.submodule_search_locations is not None:
+                continue
+            if not (spec.origin or '').startswith(root):
+                continue
+            if _uses(module, names):
+                names.add(name)
+                found = True
+    return names
+
+
+def _import_order(names):
+    # every module after the ones it imports. sys.modules is in that order at first, but reloading moves modules
+    # to its end
+    order = []
+    pending = set(names)
+    while pending:
+        ready = sorted(name for name in pending if not _uses(sys.modules[name], pending - {name}))
+        # with circular imports nothing is ready, then any order is as good as another
+        name = ready[0] if ready else min(pending)
+        pending.remove(name)
+        order.append(name)
+    return order
+
+
+def _reload(names, day_module):
+    for name in _import_order(_dependents(names)):
+        print(f'Reloading {name}')
+        importlib.reload(sys.modules[name])
+    return sys.modules[day_module.__name__]
+
+
+def watch(day_class, parts=PARTS, timeout=None, interval=0.5, input_file=None, **options):
+    day_module = sys.modules[day_class.__module__]
+    files = _watched(day_module)
+    mtimes = _mtimes(files)
+    inputs = ParsedInputs()  # by parse key, so going back to an earlier parse() finds its input as well
+
+    while True:
+        try:
+            day = getattr(day_module, day_class.__name__)(input_file=input_file)
+            key = _parse_key(day)
+            # a fresh copy every time, which also gets the reloaded classes
+            parsed = inputs.get(key)
+            if parsed is not None:
+                day.__dict__['input'] = parsed  # where cached_property keeps it
+                print('Input unchanged, not parsing again')
+            else:
+                inputs.put(key, day.input)
+
+            # the run before memoized its results, which would leave nothing to watch but memo hits
+            memo.clear_all()
+            day.run(None, timeout, parts, **options)
+        except KeyboardInterrupt:
+            print('Interrupted')
+        except Exception:
+            traceback.print_exc()
+
+        print(f'Watching {len(files)} files, ctrl-c to stop')
+        while True:
+            try:
+                changed = set()
+                while not changed:
+                    time.sleep(interval)
+                    current = _mtimes(files)
+                    # modules that were never imported don't matter to the day
+                    changed = {
+                        files[name] for name, mtime in current.items()
+                        if mtimes.get(name) != mtime and files[name] in sys.modules
+                    }
+                    mtimes = current
+            except KeyboardInterrupt:
+                return
+
+            try:
+                day_module = _reload(changed, day_module)
+                break
+            except Exception:
+                # most likely a syntax error, no point in running until the next save fixes it
+                traceback.print_exc()